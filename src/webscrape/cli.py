@@ -2,20 +2,27 @@
 
 from __future__ import annotations
 
-import asyncio
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
 from rich.console import Console
 from rich.table import Table
 
-from webscrape.config import ConfigError, load_config
-from webscrape.scraper import scrape
+from webscrape.config import ConfigError, ScrapeConfig, load_config
+from webscrape.scraper import run_sync, scrape
 
 console = Console()
 
 
+def _try_load_config(path: Path) -> ScrapeConfig | None:
+    try:
+        return load_config(path)
+    except ConfigError:
+        return None
+
+
 @click.group()
 @click.version_option(package_name="webscrape")
 def cli() -> None:
@@ -40,7 +47,7 @@ def run(config_path: str) -> None:
     console.print()
 
     with console.status("[bold green]Scraping...[/bold green]"):
-        result = asyncio.run(scrape(config))
+        result = run_sync(scrape(config, collect_data=False))
 
     table = Table(title="Scrape Results")
     table.add_column("Metric", style="cyan")
@@ -105,12 +112,14 @@ def list_configs(config_dir: str) -> None:
     table.add_column("Base URL", style="blue")
     table.add_column("Format", style="magenta")
 
-    for yaml_file in yaml_files:
-        try:
-            config = load_config(yaml_file)
-            table.add_row(yaml_file.name, config.name, config.base_url, config.export.format)
-        except ConfigError:
+    with ThreadPoolExecutor(max_workers=min(16, len(yaml_files))) as pool:
+        configs = list(pool.map(_try_load_config, yaml_files))
+
+    for yaml_file, config in zip(yaml_files, configs, strict=True):
+        if config is None:
             table.add_row(yaml_file.name, "[red]INVALID[/red]", "", "")
+        else:
+            table.add_row(yaml_file.name, config.name, config.base_url, config.export.format)
 
     console.print(table)
 
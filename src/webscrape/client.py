@@ -3,25 +3,52 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cached_property
 
 import httpx
 
+from webscrape.dns import CachedResolver, CachedResolverTransport, shared_resolver
 from webscrape.ratelimit import RateLimiter
 from webscrape.retry import calculate_backoff, get_retry_after, is_retryable_status
 from webscrape.useragent import UserAgentRotator
 
 logger = logging.getLogger(__name__)
 
+# Retry backoff waits go through this name, so tests can skip them without
+# patching asyncio.sleep for everything else.
+_sleep = asyncio.sleep
+
 
 @dataclass
 class FetchResult:
+    """Outcome of a fetch.
+
+    ``content`` is the raw body of successful responses; ``text`` decodes it on first
+    access using ``encoding``, the response charset (UTF-8 when none is declared).
+    """
+
     url: str
     status_code: int
-    text: str
-    headers: dict[str, str]
+    content: bytes
+    headers: Mapping[str, str]
     success: bool
+    encoding: str = "utf-8"
+
+    @cached_property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    @property
+    def is_utf8(self) -> bool:
+        """Whether ``content`` can be handed to a parser as UTF-8 bytes as-is."""
+        try:
+            return codecs.lookup(self.encoding).name == "utf-8"
+        except LookupError:
+            return False
 
 
 class HttpClient:
@@ -36,6 +63,10 @@ class HttpClient:
         backoff_max: float = 30.0,
         timeout: float = 30.0,
         extra_headers: dict[str, str] | None = None,
+        max_connections: int = 256,
+        max_keepalive_connections: int = 32,
+        keepalive_expiry: float = 30.0,
+        resolver: CachedResolver | None = None,
     ) -> None:
         self._rate_limiter = rate_limiter
         self._ua_rotator = ua_rotator or UserAgentRotator()
@@ -44,50 +75,91 @@ class HttpClient:
         self._backoff_max = backoff_max
         self._timeout = timeout
         self._extra_headers = extra_headers or {}
+        # An explicit User-Agent in extra_headers wins over rotation, as it always has.
+        self._rotate_ua = "user-agent" not in {k.lower() for k in self._extra_headers}
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            # Rate-limited pagination spaces same-host requests seconds apart; httpx's 5s
+            # default would drop the (HTTP/2) connection between pages and redo TLS.
+            keepalive_expiry=keepalive_expiry,
+        )
         self._client: httpx.AsyncClient | None = None
+        # Nested "async with" blocks share the open client; only the outermost closes it.
+        self._depth = 0
+        self._resolver = resolver if resolver is not None else shared_resolver()
 
     async def __aenter__(self) -> HttpClient:
-        self._client = httpx.AsyncClient(
-            timeout=self._timeout,
-            follow_redirects=True,
-            http2=True,
-        )
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                follow_redirects=True,
+                headers=self._extra_headers,
+                transport=CachedResolverTransport(
+                    self._resolver, http2=True, limits=self._limits, retries=0
+                ),
+            )
+        self._depth += 1
         return self
 
     async def __aexit__(self, *args: object) -> None:
-        if self._client:
+        if self._depth == 0:  # unmatched exit; nothing is open
+            return
+        self._depth -= 1
+        if self._depth == 0 and self._client:
             await self._client.aclose()
             self._client = None
 
-    async def fetch(self, url: str) -> FetchResult:
-        """Fetch a URL with rate limiting, retry, and UA rotation."""
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Per-domain limiter applied to every fetch."""
+        return self._rate_limiter
+
+    @property
+    def resolver(self) -> CachedResolver:
+        """DNS cache used for new connections; process-wide unless one was passed in."""
+        return self._resolver
+
+    def _require_client(self) -> httpx.AsyncClient:
         if self._client is None:
             msg = "Client not initialized. Use 'async with' context manager."
             raise RuntimeError(msg)
+        return self._client
+
+    async def raw_get(self, url: str, timeout: float | None = None) -> httpx.Response:
+        """GET a URL over the shared connection pool, without rate limiting or retries."""
+        client = self._require_client()
+        headers = {"User-Agent": self._ua_rotator.get_ua()} if self._rotate_ua else None
+        if timeout is None:
+            return await client.get(url, headers=headers)
+        return await client.get(url, headers=headers, timeout=timeout)
+
+    async def fetch(self, url: str) -> FetchResult:
+        """Fetch a URL with rate limiting, retry, and UA rotation."""
+        client = self._require_client()
 
         last_error: Exception | None = None
         for attempt in range(self._max_attempts):
             await self._rate_limiter.acquire(url)
 
-            headers = {
-                "User-Agent": self._ua_rotator.get_ua(),
-                **self._extra_headers,
-            }
+            # Extra headers live on the client; only the rotating UA is sent per request.
+            headers = {"User-Agent": self._ua_rotator.get_ua()} if self._rotate_ua else None
 
             try:
-                response = await self._client.get(url, headers=headers)
+                response = await client.get(url, headers=headers)
 
                 if response.status_code == 200:
                     return FetchResult(
                         url=url,
                         status_code=response.status_code,
-                        text=response.text,
-                        headers=dict(response.headers),
+                        content=response.content,
+                        headers=response.headers,
                         success=True,
+                        encoding=response.encoding or "utf-8",
                     )
 
                 if is_retryable_status(response.status_code):
-                    retry_after = get_retry_after(dict(response.headers))
+                    retry_after = get_retry_after(response.headers)
                     if retry_after is not None:
                         delay = retry_after
                     else:
@@ -100,14 +172,15 @@ class HttpClient:
                         self._max_attempts,
                         delay,
                     )
-                    await asyncio.sleep(delay)
+                    await _sleep(delay)
                     continue
 
+                # Callers only inspect the status of failed responses; skip keeping the body.
                 return FetchResult(
                     url=url,
                     status_code=response.status_code,
-                    text=response.text,
-                    headers=dict(response.headers),
+                    content=b"",
+                    headers=response.headers,
                     success=False,
                 )
 
@@ -122,12 +195,27 @@ class HttpClient:
                     exc,
                 )
                 if attempt < self._max_attempts - 1:
-                    await asyncio.sleep(delay)
+                    await _sleep(delay)
 
         return FetchResult(
             url=url,
             status_code=0,
-            text=str(last_error) if last_error else "Max retries exceeded",
+            content=(str(last_error) if last_error else "Max retries exceeded").encode(),
             headers={},
             success=False,
         )
+
+    async def fetch_many(self, urls: list[str], *, max_concurrency: int = 32) -> list[FetchResult]:
+        """Fetch several URLs concurrently, at most max_concurrency at a time.
+
+        Results are returned in the same order as urls.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_one(url: str) -> FetchResult:
+            async with semaphore:
+                return await self.fetch(url)
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(fetch_one(url)) for url in urls]
+        return [task.result() for task in tasks]
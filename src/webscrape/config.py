@@ -8,6 +8,11 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
 
 @dataclass
 class PaginationConfig:
@@ -36,6 +41,11 @@ class RetryConfig:
     backoff_max: float = 30.0
 
 
+@dataclass
+class ConcurrencyConfig:
+    max_inflight: int = 64
+
+
 @dataclass
 class ExportConfig:
     format: str = "json"
@@ -51,6 +61,7 @@ class ScrapeConfig:
     selectors: SelectorConfig = field(default_factory=SelectorConfig)
     rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
     retry: RetryConfig = field(default_factory=RetryConfig)
+    concurrency: ConcurrencyConfig = field(default_factory=ConcurrencyConfig)
     export: ExportConfig = field(default_factory=ExportConfig)
     headers: dict[str, str] = field(default_factory=dict)
 
@@ -59,10 +70,18 @@ class ConfigError(Exception):
     """Raised when a scrape config is invalid."""
 
 
-def _build_nested(cls: type, data: dict[str, Any] | None) -> Any:
+_PAGINATION_FIELDS = frozenset(PaginationConfig.__dataclass_fields__)
+_SELECTOR_FIELDS = frozenset(SelectorConfig.__dataclass_fields__)
+_RATE_LIMIT_FIELDS = frozenset(RateLimitConfig.__dataclass_fields__)
+_RETRY_FIELDS = frozenset(RetryConfig.__dataclass_fields__)
+_CONCURRENCY_FIELDS = frozenset(ConcurrencyConfig.__dataclass_fields__)
+_EXPORT_FIELDS = frozenset(ExportConfig.__dataclass_fields__)
+
+
+def _build_nested(cls: type, data: dict[str, Any] | None, allowed: frozenset[str]) -> Any:
     if data is None:
         return cls()
-    return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+    return cls(**{k: data[k] for k in data.keys() & allowed})
 
 
 def load_config(path: str | Path) -> ScrapeConfig:
@@ -71,8 +90,8 @@ def load_config(path: str | Path) -> ScrapeConfig:
     if not path.exists():
         raise ConfigError(f"Config file not found: {path}")
 
-    with open(path) as f:
-        raw = yaml.safe_load(f)
+    with open(path, "rb") as f:
+        raw = yaml.load(f, Loader=_Loader)
 
     if not isinstance(raw, dict):
         raise ConfigError("Config must be a YAML mapping")
@@ -86,11 +105,12 @@ def load_config(path: str | Path) -> ScrapeConfig:
         name=raw["name"],
         base_url=raw["base_url"],
         urls=raw.get("urls", []),
-        pagination=_build_nested(PaginationConfig, raw.get("pagination")),
-        selectors=_build_nested(SelectorConfig, raw.get("selectors")),
-        rate_limit=_build_nested(RateLimitConfig, raw.get("rate_limit")),
-        retry=_build_nested(RetryConfig, raw.get("retry")),
-        export=_build_nested(ExportConfig, raw.get("export")),
+        pagination=_build_nested(PaginationConfig, raw.get("pagination"), _PAGINATION_FIELDS),
+        selectors=_build_nested(SelectorConfig, raw.get("selectors"), _SELECTOR_FIELDS),
+        rate_limit=_build_nested(RateLimitConfig, raw.get("rate_limit"), _RATE_LIMIT_FIELDS),
+        retry=_build_nested(RetryConfig, raw.get("retry"), _RETRY_FIELDS),
+        concurrency=_build_nested(ConcurrencyConfig, raw.get("concurrency"), _CONCURRENCY_FIELDS),
+        export=_build_nested(ExportConfig, raw.get("export"), _EXPORT_FIELDS),
         headers=raw.get("headers", {}),
     )
 
@@ -106,10 +126,11 @@ def load_config_from_dict(data: dict[str, Any]) -> ScrapeConfig:
         name=data["name"],
         base_url=data["base_url"],
         urls=data.get("urls", []),
-        pagination=_build_nested(PaginationConfig, data.get("pagination")),
-        selectors=_build_nested(SelectorConfig, data.get("selectors")),
-        rate_limit=_build_nested(RateLimitConfig, data.get("rate_limit")),
-        retry=_build_nested(RetryConfig, data.get("retry")),
-        export=_build_nested(ExportConfig, data.get("export")),
+        pagination=_build_nested(PaginationConfig, data.get("pagination"), _PAGINATION_FIELDS),
+        selectors=_build_nested(SelectorConfig, data.get("selectors"), _SELECTOR_FIELDS),
+        rate_limit=_build_nested(RateLimitConfig, data.get("rate_limit"), _RATE_LIMIT_FIELDS),
+        retry=_build_nested(RetryConfig, data.get("retry"), _RETRY_FIELDS),
+        concurrency=_build_nested(ConcurrencyConfig, data.get("concurrency"), _CONCURRENCY_FIELDS),
+        export=_build_nested(ExportConfig, data.get("export"), _EXPORT_FIELDS),
         headers=data.get("headers", {}),
     )
@@ -0,0 +1,179 @@
+"""Async DNS resolver with a per-host LRU + TTL cache, pluggable into httpx.
+
+A process-wide resolver (see shared_resolver) lets every HttpClient, and so
+every scrape job, reuse lookups for hosts it has already seen.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from itertools import chain, zip_longest
+
+import httpcore
+import httpx
+
+
+class CachedResolver:
+    """Resolve hostnames via getaddrinfo, caching results per host.
+
+    Concurrent lookups for the same uncached host share a single in-flight query.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_hosts: int = 1024) -> None:
+        self._ttl = ttl
+        self._max_hosts = max_hosts
+        self._cache: OrderedDict[str, tuple[list[str], float]] = OrderedDict()
+        self._pending: dict[str, asyncio.Task[list[str]]] = {}
+
+    async def _lookup(self, host: str) -> list[str]:
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(str(info[4][0]) for info in infos))
+        self._cache[host] = (addresses, time.monotonic() + self._ttl)
+        self._cache.move_to_end(host)
+        while len(self._cache) > self._max_hosts:
+            self._cache.popitem(last=False)
+        return addresses
+
+    async def resolve(self, host: str) -> list[str]:
+        """Return the IP addresses for a host, using the cache when fresh."""
+        entry = self._cache.get(host)
+        if entry is not None and entry[1] > time.monotonic():
+            self._cache.move_to_end(host)
+            return entry[0]
+
+        task = self._pending.get(host)
+        # A lookup started on another event loop (e.g. an earlier asyncio.run) cannot be awaited.
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._lookup(host))
+            self._pending[host] = task
+            task.add_done_callback(lambda t: self._forget_pending(host, t))
+        return await asyncio.shield(task)
+
+    def _forget_pending(self, host: str, task: asyncio.Task[list[str]]) -> None:
+        if self._pending.get(host) is task:
+            del self._pending[host]
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_shared_resolver = CachedResolver(ttl=300.0, max_hosts=4096)
+
+# Head start each connection attempt gets before the next address is tried (RFC 8305).
+_HAPPY_EYEBALLS_DELAY = 0.25
+
+
+def shared_resolver() -> CachedResolver:
+    """Return the process-wide resolver used by HttpClient unless one is passed in."""
+    return _shared_resolver
+
+
+def _interleave_families(addresses: list[str]) -> list[str]:
+    """Alternate IPv6 and IPv4 addresses, starting with the family listed first."""
+    v6 = [a for a in addresses if ":" in a]
+    v4 = [a for a in addresses if ":" not in a]
+    first, second = (v6, v4) if ":" in addresses[0] else (v4, v6)
+    return [a for a in chain.from_iterable(zip_longest(first, second)) if a is not None]
+
+
+async def _discard_attempts(tasks: set[asyncio.Task[httpcore.AsyncNetworkStream]]) -> None:
+    """Cancel losing connection attempts, closing any that connected anyway."""
+    for task in tasks:
+        task.cancel()
+    for result in await asyncio.gather(*tasks, return_exceptions=True):
+        if isinstance(result, httpcore.AsyncNetworkStream):
+            await result.aclose()
+
+
+class _ResolvingBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that connects to cached addresses instead of resolving per connection."""
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, resolver: CachedResolver) -> None:
+        self._backend = backend
+        self._resolver = resolver
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        try:
+            async with asyncio.timeout_at(deadline):
+                addresses = await self._resolver.resolve(host)
+        except TimeoutError as exc:
+            raise httpcore.ConnectTimeout(f"DNS lookup timed out for {host}") from exc
+        except OSError as exc:
+            raise httpcore.ConnectError(str(exc)) from exc
+        if not addresses:
+            raise httpcore.ConnectError(f"No addresses found for {host}")
+        options = list(socket_options) if socket_options is not None else None
+
+        def remaining() -> float | None:
+            return None if deadline is None else max(0.0, deadline - loop.time())
+
+        async def attempt(address: str) -> httpcore.AsyncNetworkStream:
+            return await self._backend.connect_tcp(
+                address, port, remaining(), local_address, options
+            )
+
+        # Happy eyeballs: alternate address families and start the next attempt when
+        # the previous one fails or has had its head start, all under one deadline.
+        pending: set[asyncio.Task[httpcore.AsyncNetworkStream]] = set()
+        last_error: Exception | None = None
+        try:
+            for address in (*_interleave_families(addresses), None):
+                if address is not None:
+                    pending.add(asyncio.create_task(attempt(address)))
+                while pending:
+                    wait = remaining()
+                    if address is not None and (wait is None or wait > _HAPPY_EYEBALLS_DELAY):
+                        wait = _HAPPY_EYEBALLS_DELAY
+                    done, pending = await asyncio.wait(
+                        pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        exc = task.exception()
+                        if exc is None:
+                            pending |= done - {task}  # closed below if they connected too
+                            return task.result()
+                        if not isinstance(exc, httpcore.ConnectError | httpcore.TimeoutException):
+                            raise exc
+                        last_error = exc
+                    if remaining() == 0.0:
+                        raise httpcore.ConnectTimeout(f"Connection to {host} timed out")
+                    if address is not None:
+                        break  # a failure or an expired head start: try the next address
+        finally:
+            await _discard_attempts(pending)
+        assert last_error is not None
+        raise last_error
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class CachedResolverTransport(httpx.AsyncHTTPTransport):
+    """httpx transport whose new connections resolve hosts through a CachedResolver."""
+
+    def __init__(self, resolver: CachedResolver, **kwargs: object) -> None:
+        super().__init__(**kwargs)  # type: ignore[arg-type]
+        # httpx does not expose httpcore's network_backend option, so wrap the pool's backend.
+        self._pool._network_backend = _ResolvingBackend(self._pool._network_backend, resolver)
@@ -2,11 +2,33 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Protocol
 
 
 class Exporter(Protocol):
-    """Protocol for data exporters."""
+    """Protocol for data exporters.
+
+    Rows can be written in batches between open() and close(), so a scrape can
+    stream items to disk as pages arrive; export() does all three in one call.
+    After a failure, abort() replaces close() so partial output isn't finalized.
+    """
+
+    def open(self, output_path: str) -> None:
+        """Create the output and prepare it for write_rows()."""
+        ...
+
+    def write_rows(self, rows: Iterable[dict[str, str]]) -> None:
+        """Append a batch of rows to the open output."""
+        ...
+
+    def close(self) -> None:
+        """Finish and close the output."""
+        ...
+
+    def abort(self) -> None:
+        """Close the output without finishing it, after a failed write."""
+        ...
 
     def export(self, data: list[dict[str, str]], output_path: str) -> None:
         """Export data to the given output path."""
@@ -3,20 +3,70 @@
 from __future__ import annotations
 
 import csv
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
+from typing import Any, TextIO
+
+
+def _rows(data: Iterable[dict[str, str]], fieldnames: Sequence[str]) -> Iterator[Sequence[str]]:
+    """Yield each row's values in fieldname order, defaulting missing keys to ""."""
+    getter = itemgetter(*fieldnames)
+    single = len(fieldnames) == 1
+    for row in data:
+        try:
+            values = getter(row)
+        except KeyError:
+            yield [row.get(name, "") for name in fieldnames]
+            continue
+        yield (values,) if single else values
 
 
 class CsvExporter:
-    """Export data as CSV with headers."""
+    """Export data as CSV with headers, taken from the first row written."""
 
-    def export(self, data: list[dict[str, str]], output_path: str) -> None:
+    def __init__(self) -> None:
+        self._file: TextIO | None = None
+        self._writer: Any = None
+        self._fieldnames: list[str] | None = None
+
+    def open(self, output_path: str) -> None:
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        if not data:
-            path.write_text("")
-            return
-        fieldnames = list(data[0].keys())
-        with open(path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
+        self._file = open(path, "w", newline="", buffering=1 << 20)  # noqa: SIM115
+        self._writer = csv.writer(self._file)
+        self._fieldnames = None
+
+    def write_rows(self, rows: Iterable[dict[str, str]]) -> None:
+        if self._file is None:
+            msg = "Exporter not opened. Call open() before write_rows()."
+            raise RuntimeError(msg)
+        it = iter(rows)
+        if self._fieldnames is None:
+            first = next(it, None)
+            if first is None:
+                return
+            self._fieldnames = list(first.keys())
+            self._writer.writerow(self._fieldnames)
+            it = chain((first,), it)
+        self._writer.writerows(_rows(it, self._fieldnames))
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+    def abort(self) -> None:
+        # Rows are written whole and there is no footer to leave out.
+        self.close()
+
+    def export(self, data: list[dict[str, str]], output_path: str) -> None:
+        self.open(output_path)
+        try:
+            self.write_rows(data)
+        except BaseException:
+            self.abort()
+            raise
+        self.close()
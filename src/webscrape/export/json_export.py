@@ -2,15 +2,58 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Iterable
 from pathlib import Path
+from typing import BinaryIO
+
+import orjson
 
 
 class JsonExporter:
-    """Export data as a pretty-printed JSON array."""
+    """Export data as a JSON array, one object per line, written incrementally."""
 
-    def export(self, data: list[dict[str, str]], output_path: str) -> None:
+    def __init__(self) -> None:
+        self._file: BinaryIO | None = None
+        self._empty = True
+
+    def open(self, output_path: str) -> None:
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self._file = open(path, "wb", buffering=1 << 20)  # noqa: SIM115
+        self._file.write(b"[")
+        self._empty = True
+
+    def write_rows(self, rows: Iterable[dict[str, str]]) -> None:
+        f = self._require_file()
+        for row in rows:
+            f.write(b"\n" if self._empty else b",\n")
+            f.write(orjson.dumps(row, option=orjson.OPT_NON_STR_KEYS))
+            self._empty = False
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        self._file.write(b"]\n" if self._empty else b"\n]\n")
+        self._file.close()
+        self._file = None
+
+    def abort(self) -> None:
+        # No closing "]", so a truncated export doesn't parse as a complete array.
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def export(self, data: list[dict[str, str]], output_path: str) -> None:
+        self.open(output_path)
+        try:
+            self.write_rows(data)
+        except BaseException:
+            self.abort()
+            raise
+        self.close()
+
+    def _require_file(self) -> BinaryIO:
+        if self._file is None:
+            msg = "Exporter not opened. Call open() before write_rows()."
+            raise RuntimeError(msg)
+        return self._file
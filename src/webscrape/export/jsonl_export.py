@@ -0,0 +1,47 @@
+"""JSON Lines file exporter."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import BinaryIO
+
+import orjson
+
+_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+
+class JsonlExporter:
+    """Export data as JSON Lines: one object per line, no enclosing array."""
+
+    def __init__(self) -> None:
+        self._file: BinaryIO | None = None
+
+    def open(self, output_path: str) -> None:
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, "wb", buffering=1 << 20)  # noqa: SIM115
+
+    def write_rows(self, rows: Iterable[dict[str, str]]) -> None:
+        if self._file is None:
+            msg = "Exporter not opened. Call open() before write_rows()."
+            raise RuntimeError(msg)
+        self._file.writelines(orjson.dumps(row, option=_OPTIONS) for row in rows)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def abort(self) -> None:
+        # Lines are written whole and there is no footer to leave out.
+        self.close()
+
+    def export(self, data: list[dict[str, str]], output_path: str) -> None:
+        self.open(output_path)
+        try:
+            self.write_rows(data)
+        except BaseException:
+            self.abort()
+            raise
+        self.close()
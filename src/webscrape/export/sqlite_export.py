@@ -3,35 +3,90 @@
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterable
+from itertools import chain
 from pathlib import Path
 
 
+def _quote_ident(name: str) -> str:
+    """Quote an SQL identifier, escaping embedded double quotes."""
+    return '"' + name.replace('"', '""') + '"'
+
+
 class SqliteExporter:
-    """Export data to a SQLite database table."""
+    """Export data to a SQLite database table.
+
+    All batches written between open() and close() go into one transaction; the
+    table's columns come from the first row written.
+    """
 
     def __init__(self, table_name: str = "scraped_data") -> None:
         self._table_name = table_name
+        self._conn: sqlite3.Connection | None = None
+        self._columns: list[str] | None = None
+        self._insert_sql = ""
 
-    def export(self, data: list[dict[str, str]], output_path: str) -> None:
+    def open(self, output_path: str) -> None:
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        if not data:
-            conn = sqlite3.connect(str(path))
-            conn.close()
-            return
+        self._conn = sqlite3.connect(str(path))
+        # A single bulk load doesn't need an fsync per commit or an on-disk journal.
+        # MEMORY (unlike WAL) isn't stored in the file, so the output opens normally.
+        self._conn.execute("PRAGMA journal_mode=MEMORY")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("BEGIN")
+        self._columns = None
 
-        columns = list(data[0].keys())
-        col_defs = ", ".join(f'"{col}" TEXT' for col in columns)
+    def _create_table(self, columns: list[str]) -> None:
+        assert self._conn is not None
+        table = _quote_ident(self._table_name)
+        quoted = [_quote_ident(col) for col in columns]
+        col_defs = ", ".join(f"{col} TEXT" for col in quoted)
         placeholders = ", ".join("?" for _ in columns)
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({col_defs})")
+        self._insert_sql = f"INSERT INTO {table} ({', '.join(quoted)}) VALUES ({placeholders})"
+        self._columns = columns
+
+    def write_rows(self, rows: Iterable[dict[str, str]]) -> None:
+        if self._conn is None:
+            msg = "Exporter not opened. Call open() before write_rows()."
+            raise RuntimeError(msg)
+        it = iter(rows)
+        if self._columns is None:
+            first = next(it, None)
+            if first is None:
+                return
+            self._create_table(list(first.keys()))
+            it = chain((first,), it)
+        columns = self._columns
+        assert columns is not None
+        self._conn.executemany(self._insert_sql, ([row.get(c, "") for c in columns] for row in it))
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.commit()
+        finally:
+            self._conn.close()
+            self._conn = None
 
-        conn = sqlite3.connect(str(path))
+    def abort(self) -> None:
+        # Roll back everything written since open(), the table included.
+        if self._conn is None:
+            return
         try:
-            conn.execute(f'CREATE TABLE IF NOT EXISTS "{self._table_name}" ({col_defs})')
-            for row in data:
-                values = [row.get(col, "") for col in columns]
-                col_names = ", ".join(f'"{c}"' for c in columns)
-                sql = f'INSERT INTO "{self._table_name}" ({col_names}) VALUES ({placeholders})'
-                conn.execute(sql, values)
-            conn.commit()
+            self._conn.rollback()
         finally:
-            conn.close()
+            self._conn.close()
+            self._conn = None
+
+    def export(self, data: list[dict[str, str]], output_path: str) -> None:
+        self.open(output_path)
+        try:
+            self.write_rows(data)
+        except BaseException:
+            self.abort()
+            raise
+        self.close()
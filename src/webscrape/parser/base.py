@@ -2,12 +2,46 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Any, Protocol
+
+# Opaque parsed-document and compiled-selector handles; each parser uses its own types.
+Document = Any
+CompiledSelector = Any
+
+
+class CompiledParser(Protocol):
+    """Protocol for item extractors bound to one set of selectors."""
+
+    def extract_items(self, doc: Document) -> list[dict[str, str]]:
+        """Extract items from an already-parsed document."""
+        ...
+
+    def parse(self, html: str | bytes) -> list[dict[str, str]]:
+        """Parse HTML and extract items as a list of dicts."""
+        ...
 
 
 class Parser(Protocol):
     """Protocol for HTML parsers."""
 
-    def parse(self, html: str, items_selector: str, fields: dict[str, str]) -> list[dict[str, str]]:
+    def compile(self, items_selector: str, fields: dict[str, str]) -> CompiledParser:
+        """Prepare an item extractor to reuse across pages."""
+        ...
+
+    def compile_selector(self, selector: str) -> CompiledSelector:
+        """Prepare a single selector for repeated select_one_doc calls."""
+        ...
+
+    def parse_document(self, html: str | bytes) -> Document:
+        """Parse HTML (str, or UTF-8 bytes) into a document that can be queried repeatedly."""
+        ...
+
+    def select_one_doc(self, doc: Document, selector: str | CompiledSelector) -> str | None:
+        """Select a single value from a parsed document."""
+        ...
+
+    def parse(
+        self, html: str | bytes, items_selector: str, fields: dict[str, str]
+    ) -> list[dict[str, str]]:
         """Parse HTML and extract items as a list of dicts."""
         ...
@@ -1,64 +1,117 @@
-"""BeautifulSoup CSS selector parser with ::text and ::attr pseudo-selectors."""
+"""selectolax (lexbor) CSS selector parser with ::text and ::attr pseudo-selectors."""
 
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
-from bs4 import BeautifulSoup, Tag
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
-_PSEUDO_TEXT = re.compile(r"^(.+?)::text$")
-_PSEUDO_ATTR = re.compile(r"^(.+?)::attr\(([^)]+)\)$")
+# A field selector split into its CSS part and attribute name (None means text).
+CompiledSelector = tuple[str, str | None]
 
+# One pass splits "sel", "sel::text" and "sel::attr(name)"; anything else is plain CSS.
+_SUFFIX_RE = re.compile(r"^(?P<sel>.+?)(?:::(?:text|attr\((?P<attr>[^)]+)\)))?$", re.DOTALL)
 
-def _extract_field(element: Tag, selector: str) -> str | None:
-    """Extract a field value from an element using a CSS selector with pseudo-selectors."""
-    text_match = _PSEUDO_TEXT.match(selector)
-    if text_match:
-        css = text_match.group(1)
-        found = element.select_one(css)
-        if found is None:
-            return None
-        return found.get_text(strip=True)
-
-    attr_match = _PSEUDO_ATTR.match(selector)
-    if attr_match:
-        css = attr_match.group(1)
-        attr_name = attr_match.group(2)
-        found = element.select_one(css)
-        if found is None:
-            return None
-        val = found.get(attr_name)
-        if isinstance(val, list):
-            return " ".join(val)
-        return val
 
-    found = element.select_one(selector)
+@lru_cache(maxsize=1024)
+def _split_selector(selector: str) -> CompiledSelector:
+    """Split a field selector into its CSS part and attribute name (None means text)."""
+    match = _SUFFIX_RE.match(selector)
+    if match is None:  # empty selector
+        return selector, None
+    return match["sel"], match["attr"]
+
+
+def _first_descendant(node: LexborNode, css: str) -> LexborNode | None:
+    """Return the first descendant of node matching css.
+
+    Lexbor also matches the node itself; fields are always looked up inside the item.
+    """
+    found = node.css_first(css)
+    if found is not None and found.mem_id == node.mem_id:
+        matches = node.css(css)
+        return matches[1] if len(matches) > 1 else None
+    return found
+
+
+def _extract_node(node: LexborNode, css: str, attr: str | None) -> str | None:
+    found = _first_descendant(node, css)
     if found is None:
         return None
-    return found.get_text(strip=True)
+    if attr is None:
+        return found.text(strip=True)
+    return found.attributes.get(attr)
+
+
+class CompiledCssParser:
+    """CSS item extractor with its selectors pre-split, reusable across pages."""
+
+    def __init__(self, items_selector: str, fields: dict[str, str]) -> None:
+        self._items_selector = items_selector
+        self._fields = [(name, *_split_selector(selector)) for name, selector in fields.items()]
+
+    def extract_items(self, doc: LexborHTMLParser) -> list[dict[str, str]]:
+        """Extract items from an already-parsed document."""
+        return [
+            {name: _extract_node(item, css, attr) or "" for name, css, attr in self._fields}
+            for item in doc.css(self._items_selector)
+        ]
+
+    def parse(self, html: str | bytes) -> list[dict[str, str]]:
+        """Parse HTML and extract items as a list of dicts."""
+        return self.extract_items(LexborHTMLParser(html))
 
 
 class CssParser:
-    """Parse HTML using CSS selectors with BeautifulSoup."""
+    """Parse HTML using CSS selectors with selectolax's lexbor engine."""
+
+    def __init__(self) -> None:
+        self._compiled: dict[tuple[str, tuple[tuple[str, str], ...]], CompiledCssParser] = {}
+
+    def compile(self, items_selector: str, fields: dict[str, str]) -> CompiledCssParser:
+        """Prepare an item extractor to reuse for every page of a scrape job.
+
+        Extractors are memoized per selector set, so repeated parse() calls with the
+        same fields skip re-splitting the ::text/::attr suffixes.
+        """
+        key = (items_selector, tuple(fields.items()))
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._compiled[key] = CompiledCssParser(items_selector, fields)
+        return compiled
+
+    def compile_selector(self, selector: str) -> CompiledSelector:
+        """Pre-split a single selector for repeated select_one/select_one_doc calls."""
+        return _split_selector(selector)
+
+    def parse_document(self, html: str | bytes) -> LexborHTMLParser:
+        """Parse HTML once so items and pagination can be read from the same tree.
 
-    def parse(self, html: str, items_selector: str, fields: dict[str, str]) -> list[dict[str, str]]:
+        Bytes are parsed as UTF-8 without an intermediate str.
+        """
+        return LexborHTMLParser(html)
+
+    def extract_items(
+        self, doc: LexborHTMLParser, items_selector: str, fields: dict[str, str]
+    ) -> list[dict[str, str]]:
+        """Extract items from an already-parsed document."""
+        return self.compile(items_selector, fields).extract_items(doc)
+
+    def select_one_doc(self, doc: LexborHTMLParser, selector: str | CompiledSelector) -> str | None:
+        """Select a single element from a parsed document and return its text or attribute."""
+        root = doc.body or doc.root
+        if root is None:
+            return None
+        css, attr = _split_selector(selector) if isinstance(selector, str) else selector
+        return _extract_node(root, css, attr)
+
+    def parse(
+        self, html: str | bytes, items_selector: str, fields: dict[str, str]
+    ) -> list[dict[str, str]]:
         """Parse HTML and extract items as a list of dicts."""
-        soup = BeautifulSoup(html, "lxml")
-        items = soup.select(items_selector)
-        results: list[dict[str, str]] = []
-        for item in items:
-            row: dict[str, str] = {}
-            for field_name, selector in fields.items():
-                value = _extract_field(item, selector)
-                row[field_name] = value if value is not None else ""
-            results.append(row)
-        return results
-
-    def select_one(self, html: str, selector: str) -> str | None:
+        return self.extract_items(self.parse_document(html), items_selector, fields)
+
+    def select_one(self, html: str | bytes, selector: str | CompiledSelector) -> str | None:
         """Select a single element and return its text or attribute."""
-        soup = BeautifulSoup(html, "lxml")
-        # Create a wrapper tag for _extract_field
-        body = soup.find("body") or soup
-        if not isinstance(body, Tag):
-            return None
-        return _extract_field(body, selector)
+        return self.select_one_doc(self.parse_document(html), selector)
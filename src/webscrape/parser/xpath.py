@@ -2,36 +2,105 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Any
+
+from lxml import etree
 from lxml import html as lxml_html
 
 
-class XPathParser:
-    """Parse HTML using XPath expressions with lxml."""
+@lru_cache(maxsize=256)
+def _compile_xpath(expr: str) -> etree.XPath:
+    """Compile an XPath expression once and reuse it across parse calls."""
+    return etree.XPath(expr, smart_strings=False)
 
-    def parse(self, html: str, items_selector: str, fields: dict[str, str]) -> list[dict[str, str]]:
-        """Parse HTML and extract items as a list of dicts."""
-        tree = lxml_html.fromstring(html)
-        items = tree.xpath(items_selector)
+
+def _parse_html(html: str | bytes, parser: lxml_html.HTMLParser) -> lxml_html.HtmlElement:
+    """Parse HTML (str, or UTF-8 bytes) with a reusable parser.
+
+    Empty input yields an empty document.
+    """
+    root = etree.fromstring(html.encode("utf-8") if isinstance(html, str) else html, parser)
+    if root is None:
+        root = etree.fromstring(b"<html></html>", parser)
+    return root
+
+
+def _new_parser() -> lxml_html.HTMLParser:
+    return lxml_html.HTMLParser(recover=True, encoding="utf-8")
+
+
+def _first_value(values: Any) -> str | None:
+    if not values:
+        return None
+    val = values[0]
+    return val.strip() if isinstance(val, str) else val.text_content().strip()
+
+
+class CompiledXPathParser:
+    """XPath item extractor with its expressions precompiled, reusable across pages."""
+
+    def __init__(self, items_selector: str, fields: dict[str, str]) -> None:
+        self._items_xpath = _compile_xpath(items_selector)
+        self._fields = [(name, _compile_xpath(expr)) for name, expr in fields.items()]
+        self._parser = _new_parser()
+
+    def extract_items(self, doc: lxml_html.HtmlElement) -> list[dict[str, str]]:
+        """Extract items from an already-parsed document."""
         results: list[dict[str, str]] = []
-        for item in items:
+        for item in self._items_xpath(doc):
             row: dict[str, str] = {}
-            for field_name, xpath_expr in fields.items():
-                values = item.xpath(xpath_expr)
-                if values:
-                    val = values[0]
-                    row[field_name] = (
-                        val.strip() if isinstance(val, str) else val.text_content().strip()
-                    )
-                else:
-                    row[field_name] = ""
+            for field_name, xpath in self._fields:
+                value = _first_value(xpath(item))
+                row[field_name] = value if value is not None else ""
             results.append(row)
         return results
 
-    def select_one(self, html: str, xpath_expr: str) -> str | None:
+    def parse(self, html: str | bytes) -> list[dict[str, str]]:
+        """Parse HTML and extract items as a list of dicts."""
+        return self.extract_items(_parse_html(html, self._parser))
+
+
+class XPathParser:
+    """Parse HTML using XPath expressions with lxml."""
+
+    def __init__(self) -> None:
+        self._parser = _new_parser()
+
+    def compile(self, items_selector: str, fields: dict[str, str]) -> CompiledXPathParser:
+        """Prepare an item extractor to reuse for every page of a scrape job."""
+        return CompiledXPathParser(items_selector, fields)
+
+    def compile_selector(self, xpath_expr: str) -> etree.XPath:
+        """Compile a single expression for repeated select_one/select_one_doc calls."""
+        return _compile_xpath(xpath_expr)
+
+    def parse_document(self, html: str | bytes) -> lxml_html.HtmlElement:
+        """Parse HTML once so items and pagination can be read from the same tree.
+
+        Bytes are parsed as UTF-8 without an intermediate str.
+        """
+        return _parse_html(html, self._parser)
+
+    def extract_items(
+        self, doc: lxml_html.HtmlElement, items_selector: str, fields: dict[str, str]
+    ) -> list[dict[str, str]]:
+        """Extract items from an already-parsed document."""
+        return self.compile(items_selector, fields).extract_items(doc)
+
+    def select_one_doc(
+        self, doc: lxml_html.HtmlElement, xpath_expr: str | etree.XPath
+    ) -> str | None:
+        """Select a single value from a parsed document using an XPath expression."""
+        xpath = _compile_xpath(xpath_expr) if isinstance(xpath_expr, str) else xpath_expr
+        return _first_value(xpath(doc))
+
+    def parse(
+        self, html: str | bytes, items_selector: str, fields: dict[str, str]
+    ) -> list[dict[str, str]]:
+        """Parse HTML and extract items as a list of dicts."""
+        return self.extract_items(self.parse_document(html), items_selector, fields)
+
+    def select_one(self, html: str | bytes, xpath_expr: str | etree.XPath) -> str | None:
         """Select a single value using an XPath expression."""
-        tree = lxml_html.fromstring(html)
-        values = tree.xpath(xpath_expr)
-        if not values:
-            return None
-        val = values[0]
-        return val.strip() if isinstance(val, str) else val.text_content().strip()
+        return self.select_one_doc(self.parse_document(html), xpath_expr)
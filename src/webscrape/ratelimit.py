@@ -4,35 +4,31 @@ from __future__ import annotations
 
 import asyncio
 import time
-from urllib.parse import urlparse
 
 
 class TokenBucket:
-    """Async token bucket rate limiter."""
+    """Async token bucket rate limiter.
+
+    Each acquire reserves the next free slot on a monotonic schedule and sleeps
+    until it, so waiters wake exactly once instead of polling for tokens. The
+    reservation runs without awaiting, so it is atomic on the event loop and
+    needs no lock.
+    """
 
     def __init__(self, rate: float, burst: int) -> None:
         self._rate = rate
         self._burst = burst
-        self._tokens = float(burst)
-        self._last_refill = time.monotonic()
-        self._lock = asyncio.Lock()
-
-    def _refill(self) -> None:
-        now = time.monotonic()
-        elapsed = now - self._last_refill
-        self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
-        self._last_refill = now
+        self._next_slot = time.monotonic()
 
     async def acquire(self) -> None:
         """Wait until a token is available, then consume it."""
-        while True:
-            async with self._lock:
-                self._refill()
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
-                    return
-                wait_time = (1.0 - self._tokens) / self._rate
-            await asyncio.sleep(wait_time)
+        now = time.monotonic()
+        interval = 1.0 / self._rate
+        self._next_slot = max(self._next_slot, now) + interval
+        # Up to `burst` slots may be reserved ahead of the clock without waiting.
+        delay = self._next_slot - now - self._burst * interval
+        if delay > 0:
+            await asyncio.sleep(delay)
 
     @property
     def rate(self) -> float:
@@ -52,14 +48,19 @@ class RateLimiter:
         self._buckets: dict[str, TokenBucket] = {}
 
     def _get_domain(self, url: str) -> str:
-        return urlparse(url).netloc
+        # Same result as urlparse(url).netloc for absolute URLs, without the full parse.
+        netloc = url.partition("://")[2]
+        for sep in "/?#":
+            netloc = netloc.partition(sep)[0]
+        return netloc
 
     def get_bucket(self, url: str) -> TokenBucket:
         """Get or create a token bucket for the given URL's domain."""
         domain = self._get_domain(url)
-        if domain not in self._buckets:
-            self._buckets[domain] = TokenBucket(self._default_rate, self._default_burst)
-        return self._buckets[domain]
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = self._buckets[domain] = TokenBucket(self._default_rate, self._default_burst)
+        return bucket
 
     def set_domain_rate(self, domain: str, rate: float) -> None:
         """Set a custom rate for a specific domain."""
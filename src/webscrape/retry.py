@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import random
+from collections.abc import Mapping
+
+_random = random.random
 
 RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 NON_RETRYABLE_STATUS_CODES = {400, 401, 403, 404}
@@ -19,11 +22,10 @@ def calculate_backoff(
     backoff_max: float = 30.0,
 ) -> float:
     """Calculate backoff delay with exponential increase and jitter."""
-    delay = min(backoff_base * (2**attempt) + random.uniform(0, 1), backoff_max)
-    return delay
+    return min(backoff_base * (1 << attempt) + _random(), backoff_max)
 
 
-def get_retry_after(headers: dict[str, str]) -> float | None:
+def get_retry_after(headers: Mapping[str, str]) -> float | None:
     """Extract Retry-After value from response headers."""
     value = headers.get("retry-after") or headers.get("Retry-After")
     if value is None:
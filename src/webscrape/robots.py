@@ -3,21 +3,38 @@
 from __future__ import annotations
 
 import logging
-from urllib.parse import urlparse
+import time
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse, urlsplit
 from urllib.robotparser import RobotFileParser
 
 import httpx
 
+if TYPE_CHECKING:
+    from webscrape.client import HttpClient
+
 logger = logging.getLogger(__name__)
 
+_ALLOWED_CACHE_SIZE = 8192
+
 
 class RobotsChecker:
-    """Check robots.txt compliance per domain with caching."""
+    """Check robots.txt compliance per domain with caching.
+
+    Fetched results (including "no robots.txt") are reused for ``ttl`` seconds, so a
+    checker shared across scrape jobs skips the request for domains it has seen.
+    Server errors and connection failures allow all but are retried on the next job.
+    """
 
-    def __init__(self, user_agent: str = "*") -> None:
+    def __init__(self, user_agent: str = "*", ttl: float = 3600.0) -> None:
         self._user_agent = user_agent
-        self._parsers: dict[str, RobotFileParser] = {}
+        self._ttl = ttl
+        # None means the domain has no robots.txt (404/410): everything is allowed.
+        self._parsers: dict[str, RobotFileParser | None] = {}
+        self._expires: dict[str, float] = {}
         self._crawl_delays: dict[str, float | None] = {}
+        # (netloc, path, query) -> decision; cleared whenever any domain's rules change.
+        self._allowed: dict[tuple[str, str, str], bool] = {}
 
     def _get_robots_url(self, url: str) -> str:
         parsed = urlparse(url)
@@ -26,44 +43,59 @@ class RobotsChecker:
     def _get_domain(self, url: str) -> str:
         return urlparse(url).netloc
 
-    async def fetch_robots(self, url: str, client: httpx.AsyncClient | None = None) -> None:
-        """Fetch and parse robots.txt for the domain of the given URL."""
+    async def fetch_robots(self, url: str, client: HttpClient) -> None:
+        """Fetch and parse robots.txt for the domain of the given URL.
+
+        The request goes through the scrape's own client, so it reuses (and warms) the
+        connection that later page fetches to the same host will use.
+        """
         domain = self._get_domain(url)
-        if domain in self._parsers:
+        if domain in self._parsers and self._expires.get(domain, float("inf")) > time.monotonic():
             return
 
         robots_url = self._get_robots_url(url)
-        parser = RobotFileParser()
+        parser: RobotFileParser | None = RobotFileParser()
+        ttl = self._ttl
 
         try:
-            if client:
-                response = await client.get(robots_url, timeout=10.0)
-                if response.status_code == 200:
-                    parser.parse(response.text.splitlines())
-                else:
-                    parser.allow_all = True
+            response = await client.raw_get(robots_url, timeout=10.0)
+            if response.status_code == 200:
+                parser.parse(response.text.splitlines())
+            elif response.status_code in (404, 410):
+                parser = None
             else:
-                async with httpx.AsyncClient() as temp_client:
-                    response = await temp_client.get(robots_url, timeout=10.0)
-                    if response.status_code == 200:
-                        parser.parse(response.text.splitlines())
-                    else:
-                        parser.allow_all = True
+                # Anything else allows all; other 4xx, 401/403 included, mean robots.txt
+                # is unavailable (RFC 9309 section 2.3.1.3).
+                parser.allow_all = True
+                if response.status_code >= 500:
+                    ttl = 0.0  # server trouble is transient; retry on the next job
+                    logger.warning(
+                        "robots.txt for %s returned %d, allowing all",
+                        domain,
+                        response.status_code,
+                    )
         except (httpx.ConnectError, httpx.TimeoutException):
             parser.allow_all = True
+            ttl = 0.0  # don't let a transient failure stick; retry on the next job
             logger.warning("Could not fetch robots.txt for %s, allowing all", domain)
 
         self._parsers[domain] = parser
-        delay = parser.crawl_delay(self._user_agent)
-        self._crawl_delays[domain] = delay
+        self._expires[domain] = time.monotonic() + ttl
+        self._crawl_delays[domain] = parser.crawl_delay(self._user_agent) if parser else None
+        self._allowed.clear()
 
     def is_allowed(self, url: str) -> bool:
         """Check if a URL is allowed by robots.txt."""
-        domain = self._get_domain(url)
-        parser = self._parsers.get(domain)
-        if parser is None:
-            return True
-        return parser.can_fetch(self._user_agent, url)
+        parts = urlsplit(url)
+        key = (parts.netloc, parts.path, parts.query)
+        allowed = self._allowed.get(key)
+        if allowed is None:
+            parser = self._parsers.get(parts.netloc)
+            allowed = parser is None or parser.can_fetch(self._user_agent, url)
+            if len(self._allowed) >= _ALLOWED_CACHE_SIZE:
+                self._allowed.clear()
+            self._allowed[key] = allowed
+        return allowed
 
     def get_crawl_delay(self, url: str) -> float | None:
         """Get the Crawl-delay for the domain of the given URL."""
@@ -75,4 +107,6 @@ class RobotsChecker:
         parser = RobotFileParser()
         parser.parse(content.splitlines())
         self._parsers[domain] = parser
+        self._expires.pop(domain, None)
         self._crawl_delays[domain] = parser.crawl_delay(self._user_agent)
+        self._allowed.clear()
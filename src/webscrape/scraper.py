@@ -3,15 +3,26 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import logging
+import multiprocessing
+import os
 import time
+from collections.abc import Awaitable, Coroutine
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
-from urllib.parse import urljoin
+from functools import cache
+from itertools import chain
+from operator import itemgetter
+from typing import Any, TypeVar
+from urllib.parse import urljoin, urlparse
 
 from webscrape.client import FetchResult, HttpClient
 from webscrape.config import ScrapeConfig
 from webscrape.export.csv_export import CsvExporter
 from webscrape.export.json_export import JsonExporter
+from webscrape.export.jsonl_export import JsonlExporter
 from webscrape.export.sqlite_export import SqliteExporter
 from webscrape.parser.css import CssParser
 from webscrape.parser.xpath import XPathParser
@@ -21,6 +32,13 @@ from webscrape.useragent import UserAgentRotator
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Pages larger than this are parsed in a worker process so parsing cannot stall the loop.
+PARSE_OFFLOAD_THRESHOLD = 256 * 1024
+
+_parse_pool: ProcessPoolExecutor | None = None
+
 
 @dataclass
 class ScrapeResult:
@@ -37,57 +55,186 @@ def _get_parser(parser_type: str) -> CssParser | XPathParser:
     return CssParser()
 
 
-def _get_exporter(fmt: str) -> JsonExporter | CsvExporter | SqliteExporter:
+@cache
+def _worker_parser(parser_type: str) -> CssParser | XPathParser:
+    return _get_parser(parser_type)
+
+
+def _parse_page_blob(
+    html: str | bytes,
+    parser_type: str,
+    items_selector: str,
+    fields: dict[str, str],
+    next_selector: str | None,
+) -> tuple[list[dict[str, str]], str | None]:
+    """Parse one page in a worker process; returns its items and next-page link."""
+    parser = _worker_parser(parser_type)
+    doc = parser.parse_document(html)
+    items = parser.compile(items_selector, fields).extract_items(doc)
+    next_link = parser.select_one_doc(doc, next_selector) if next_selector else None
+    return items, next_link
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _parse_pool
+    if _parse_pool is None:
+        # The scraper is multi-threaded (DNS lookups run in executor threads), so fork()
+        # could deadlock a child; start workers from a clean process instead.
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        _parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context)
+    return _parse_pool
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a pool so the next large page starts a fresh one."""
+    global _parse_pool
+    if _parse_pool is pool:
+        _parse_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+@atexit.register
+def _shutdown_parse_pool() -> None:
+    if _parse_pool is not None:
+        _discard_parse_pool(_parse_pool)
+
+
+async def _parse_in_pool(
+    html: str | bytes,
+    parser_type: str,
+    items_selector: str,
+    fields: dict[str, str],
+    next_selector: str | None,
+) -> tuple[list[dict[str, str]], str | None]:
+    pool = _get_parse_pool()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            pool, _parse_page_blob, html, parser_type, items_selector, fields, next_selector
+        )
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); this page fails, later ones get a new pool.
+        _discard_parse_pool(pool)
+        raise
+
+
+def _get_exporter(fmt: str) -> JsonExporter | JsonlExporter | CsvExporter | SqliteExporter:
     if fmt == "csv":
         return CsvExporter()
+    if fmt == "jsonl":
+        return JsonlExporter()
     if fmt == "sqlite":
         return SqliteExporter()
     return JsonExporter()
 
 
-async def scrape(config: ScrapeConfig, on_progress: object = None) -> ScrapeResult:
-    """Run a scrape job based on the given config."""
+async def scrape(
+    config: ScrapeConfig,
+    on_progress: object = None,
+    *,
+    collect_data: bool = True,
+    robots_checker: RobotsChecker | None = None,
+    client: HttpClient | None = None,
+) -> ScrapeResult:
+    """Run a scrape job based on the given config.
+
+    Items are streamed to the exporter as pages arrive, so the export is in page
+    completion order; ScrapeResult.data is in input-URL order. With collect_data=False
+    items are not also kept on ScrapeResult.data, so memory stays bounded by
+    max_inflight pages. An export error stops the job and is raised.
+    Pass the same robots_checker to several jobs to reuse robots.txt results, and an
+    open client to keep its connection pool warm between jobs; a passed-in client keeps
+    its own rate limits, retry and header settings instead of the config's. robots.txt
+    Crawl-delay values are set on that client's rate limiter and stay in effect for
+    later jobs using it.
+    """
     start_time = time.monotonic()
     result = ScrapeResult()
 
-    rate_limiter = RateLimiter(
-        default_rate=config.rate_limit.requests_per_second,
-        default_burst=config.rate_limit.burst,
-    )
-    ua_rotator = UserAgentRotator()
-    robots_checker = RobotsChecker()
+    if robots_checker is None:
+        robots_checker = RobotsChecker()
     parser = _get_parser(config.selectors.parser)
+    page_parser = parser.compile(config.selectors.items, config.selectors.fields)
+    next_selector = (
+        parser.compile_selector(config.pagination.next_selector)
+        if config.pagination.next_selector
+        else None
+    )
     exporter = _get_exporter(config.export.format)
+    # Neither the callback nor the parser changes mid-scrape, so check them once.
+    progress = on_progress if callable(on_progress) else None
+    follow_pages = (
+        config.pagination.enabled
+        and next_selector is not None
+        and hasattr(parser, "select_one_doc")
+    )
+    max_inflight = max(1, config.concurrency.max_inflight)
 
-    async with HttpClient(
-        rate_limiter=rate_limiter,
-        ua_rotator=ua_rotator,
-        max_attempts=config.retry.max_attempts,
-        backoff_base=config.retry.backoff_base,
-        backoff_max=config.retry.backoff_max,
-        extra_headers=config.headers,
-    ) as client:
-        urls_to_scrape = list(config.urls)
+    if client is None:
+        client = HttpClient(
+            rate_limiter=RateLimiter(
+                default_rate=config.rate_limit.requests_per_second,
+                default_burst=config.rate_limit.burst,
+            ),
+            ua_rotator=UserAgentRotator(),
+            max_attempts=config.retry.max_attempts,
+            backoff_base=config.retry.backoff_base,
+            backoff_max=config.retry.backoff_max,
+            extra_headers=config.headers,
+            max_connections=max_inflight,
+            max_keepalive_connections=max_inflight,
+        )
+    rate_limiter = client.rate_limiter
+
+    async with client:
+        # Duplicate inputs would only refetch the same pages.
+        urls_to_scrape = list(dict.fromkeys(config.urls))
         if not urls_to_scrape and config.base_url:
             urls_to_scrape = [config.base_url]
 
-        # Fetch robots.txt for each unique domain
-        domains_checked: set[str] = set()
+        # Fetch robots.txt once per unique domain, all domains concurrently
+        domains: dict[str, str] = {}
         for url in urls_to_scrape:
-            from urllib.parse import urlparse
+            domains.setdefault(urlparse(url).netloc, url)
+        await asyncio.gather(
+            *(robots_checker.fetch_robots(url, client) for url in domains.values())
+        )
+        for domain, url in domains.items():
+            crawl_delay = robots_checker.get_crawl_delay(url)
+            if crawl_delay is not None:
+                rate_limiter.set_domain_rate(domain, 1.0 / crawl_delay)
+
+        # Bounded, so a slow exporter holds back fetching instead of buffering pages.
+        batches: asyncio.Queue[tuple[int, list[dict[str, str]]] | None] = asyncio.Queue(
+            maxsize=max_inflight
+        )
 
-            domain = urlparse(url).netloc
-            if domain not in domains_checked:
-                await robots_checker.fetch_robots(url, client._client)
-                crawl_delay = robots_checker.get_crawl_delay(url)
-                if crawl_delay is not None:
-                    rate_limiter.set_domain_rate(domain, 1.0 / crawl_delay)
-                domains_checked.add(domain)
+        # Page batches, tagged with their URL's index, are kept as-is and put back in
+        # input order once at the end.
+        collected: list[tuple[int, list[dict[str, str]]]] = []
 
-        all_data: list[dict[str, str]] = []
+        async def write_batches() -> None:
+            # Single writer: the output is only created once there is something to write.
+            opened = False
+            try:
+                while (item := await batches.get()) is not None:
+                    batch = item[1]
+                    if not opened:
+                        exporter.open(config.export.output)
+                        opened = True
+                    exporter.write_rows(batch)
+                    result.items_found += len(batch)
+                    if collect_data:
+                        collected.append(item)
+            except BaseException:
+                # Failed or cancelled: leave the output visibly unfinished.
+                if opened:
+                    exporter.abort()
+                raise
+            if opened:
+                exporter.close()
 
-        async def scrape_url(url: str) -> list[dict[str, str]]:
-            items: list[dict[str, str]] = []
+        async def scrape_url(index: int, url: str) -> None:
             current_url: str | None = url
             pages_fetched = 0
             max_pages = config.pagination.max_pages if config.pagination.enabled else 1
@@ -106,45 +253,84 @@ async def scrape(config: ScrapeConfig, on_progress: object = None) -> ScrapeResu
                 result.urls_scraped += 1
                 pages_fetched += 1
 
-                page_items = parser.parse(
-                    fetch_result.text,
-                    config.selectors.items,
-                    config.selectors.fields,
-                )
-                items.extend(page_items)
-
-                if on_progress and callable(on_progress):
-                    on_progress(current_url, len(page_items))
-
-                if config.pagination.enabled and config.pagination.next_selector:
-                    if hasattr(parser, "select_one"):
-                        next_link = parser.select_one(
-                            fetch_result.text, config.pagination.next_selector
-                        )
-                        current_url = urljoin(current_url, next_link) if next_link else None
-                    else:
-                        current_url = None
+                # Parsers take UTF-8 bytes directly; other charsets are decoded first.
+                markup = fetch_result.content if fetch_result.is_utf8 else fetch_result.text
+                next_link: str | None = None
+                if len(markup) > PARSE_OFFLOAD_THRESHOLD:
+                    page_items, next_link = await _parse_in_pool(
+                        markup,
+                        config.selectors.parser,
+                        config.selectors.items,
+                        config.selectors.fields,
+                        config.pagination.next_selector if follow_pages else None,
+                    )
                 else:
-                    current_url = None
+                    doc = parser.parse_document(markup)
+                    page_items = page_parser.extract_items(doc)
+                    if follow_pages:
+                        next_link = parser.select_one_doc(doc, next_selector)
+                if page_items:
+                    await batches.put((index, page_items))
+
+                if progress is not None:
+                    progress(current_url, len(page_items))
+
+                current_url = urljoin(current_url, next_link) if next_link else None
 
-            return items
+        inflight = asyncio.Semaphore(max_inflight)
 
-        tasks = [scrape_url(url) for url in urls_to_scrape]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def bounded_scrape_url(index: int, url: str) -> None:
+            async with inflight:
+                return await scrape_url(index, url)
+
+        writer = asyncio.create_task(write_batches())
+
+        async def unless_writer_fails(aw: Awaitable[T]) -> T:
+            # The writer only finishes before the end-of-input marker if exporting
+            # failed; stop waiting then and raise its error.
+            task = asyncio.ensure_future(aw)
+            try:
+                await asyncio.wait({task, writer}, return_when=asyncio.FIRST_COMPLETED)
+                if not task.done():
+                    await writer
+                return task.result()
+            finally:
+                if not task.done():
+                    task.cancel()
+                    await asyncio.gather(task, return_exceptions=True)
+
+        try:
+            tasks = [bounded_scrape_url(i, url) for i, url in enumerate(urls_to_scrape)]
+            results = await unless_writer_fails(asyncio.gather(*tasks, return_exceptions=True))
+            await unless_writer_fails(batches.put(None))
+            await writer
+        finally:
+            # On error or cancellation, stop the writer so it closes the exporter.
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+        collected.sort(key=itemgetter(0))
+        result.data = list(chain.from_iterable(batch for _, batch in collected))
 
         for r in results:
             if isinstance(r, Exception):
                 logger.error("Scrape task failed: %s", r)
                 result.errors += 1
-            else:
-                all_data.extend(r)
-
-        result.items_found = len(all_data)
-        result.data = all_data
 
-        if all_data:
-            exporter.export(all_data, config.export.output)
-            logger.info("Exported %d items to %s", len(all_data), config.export.output)
+        if result.items_found:
+            logger.info("Exported %d items to %s", result.items_found, config.export.output)
 
     result.duration = time.monotonic() - start_time
     return result
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    The event loop cannot be swapped once scrape() is running, so synchronous
+    entry points (like the CLI) should start scrapes through this.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
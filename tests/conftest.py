@@ -1,5 +1,12 @@
+import asyncio
+from functools import cache
+
 import pytest
 
+from webscrape.parser.css import CssParser
+from webscrape.parser.xpath import XPathParser
+from webscrape.robots import RobotsChecker
+
 SAMPLE_HTML = """<!DOCTYPE html>
 <html>
 <head><title>Test Page</title></head>
@@ -44,16 +51,38 @@ SAMPLE_HTML_PAGE2 = """<!DOCTYPE html>
 </html>"""
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html():
     return SAMPLE_HTML
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html_page2():
     return SAMPLE_HTML_PAGE2
 
 
+@pytest.fixture(scope="session")
+def sample_html_bytes():
+    return SAMPLE_HTML.encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def sample_html_page2_bytes():
+    return SAMPLE_HTML_PAGE2.encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def sample_css_tree():
+    """SAMPLE_HTML parsed once by the CSS parser; treat it as read-only."""
+    return CssParser().parse_document(SAMPLE_HTML)
+
+
+@pytest.fixture(scope="session")
+def sample_xpath_tree():
+    """SAMPLE_HTML parsed once by the XPath parser; treat it as read-only."""
+    return XPathParser().parse_document(SAMPLE_HTML)
+
+
 @pytest.fixture
 def sample_config_dict():
     return {
@@ -84,3 +113,29 @@ def sample_config_yaml(tmp_path, sample_config_dict):
     config_file = tmp_path / "test_config.yaml"
     config_file.write_text(yaml.dump(sample_config_dict))
     return config_file
+
+
+@pytest.fixture(scope="module")
+def robots_checker_factory():
+    """Return checkers preloaded with a robots.txt body, parsed once per module.
+
+    Checkers are shared between tests, so only use them for read-only checks.
+    """
+
+    @cache
+    def make(host: str, body: str) -> RobotsChecker:
+        checker = RobotsChecker()
+        checker.set_robots_txt(host, body)
+        return checker
+
+    return make
+
+
+@pytest.fixture
+def fast_sleep(monkeypatch):
+    """Make HttpClient's retry backoff return immediately (still yielding to the loop)."""
+
+    async def _sleep(delay):
+        await asyncio.sleep(0)
+
+    monkeypatch.setattr("webscrape.client._sleep", _sleep)
@@ -1,5 +1,7 @@
 """Tests for async httpx client with retry and rate limiting."""
 
+import asyncio
+
 import httpx
 import pytest
 import respx
@@ -31,10 +33,29 @@ class TestHttpClient:
         assert result.success is True
         assert result.status_code == 200
         assert result.text == "Hello World"
+        assert result.headers["Content-Type"].startswith("text/plain")
+        assert result.content == b"Hello World"
+        assert result.is_utf8
 
     @pytest.mark.asyncio
     @respx.mock
-    async def test_retry_on_503(self, rate_limiter, ua_rotator):
+    async def test_body_kept_as_bytes_with_charset(self, rate_limiter, ua_rotator):
+        respx.get("https://example.com/test").mock(
+            return_value=httpx.Response(
+                200,
+                content="café".encode("latin-1"),
+                headers={"Content-Type": "text/html; charset=iso-8859-1"},
+            )
+        )
+        async with HttpClient(rate_limiter, ua_rotator) as client:
+            result = await client.fetch("https://example.com/test")
+        assert result.content == b"caf\xe9"
+        assert not result.is_utf8
+        assert result.text == "café"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_retry_on_503(self, rate_limiter, ua_rotator, fast_sleep):
         route = respx.get("https://example.com/test")
         route.side_effect = [
             httpx.Response(503, text="Service Unavailable"),
@@ -57,6 +78,7 @@ class TestHttpClient:
             result = await client.fetch("https://example.com/test")
         assert result.success is False
         assert result.status_code == 404
+        assert result.text == ""
 
     @pytest.mark.asyncio
     @respx.mock
@@ -71,7 +93,7 @@ class TestHttpClient:
 
     @pytest.mark.asyncio
     @respx.mock
-    async def test_max_retries_exceeded(self, rate_limiter, ua_rotator):
+    async def test_max_retries_exceeded(self, rate_limiter, ua_rotator, fast_sleep):
         respx.get("https://example.com/test").mock(return_value=httpx.Response(503, text="Down"))
         async with HttpClient(
             rate_limiter, ua_rotator, max_attempts=2, backoff_base=0.01, backoff_max=0.02
@@ -91,10 +113,23 @@ class TestHttpClient:
             await client.fetch("https://example.com/test")
         request = route.calls[0].request
         assert request.headers["accept-language"] == "en-US"
+        assert request.headers["user-agent"] == "TestBot/1.0"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_extra_user_agent_overrides_rotation(self, rate_limiter, ua_rotator):
+        route = respx.get("https://example.com/test").mock(
+            return_value=httpx.Response(200, text="OK")
+        )
+        async with HttpClient(
+            rate_limiter, ua_rotator, extra_headers={"User-Agent": "Pinned/1.0"}
+        ) as client:
+            await client.fetch("https://example.com/test")
+        assert route.calls[0].request.headers["user-agent"] == "Pinned/1.0"
 
     @pytest.mark.asyncio
     @respx.mock
-    async def test_retry_after_header(self, rate_limiter, ua_rotator):
+    async def test_retry_after_header(self, rate_limiter, ua_rotator, fast_sleep):
         route = respx.get("https://example.com/test")
         route.side_effect = [
             httpx.Response(429, text="Too Many", headers={"Retry-After": "0.01"}),
@@ -111,3 +146,63 @@ class TestHttpClient:
         client = HttpClient(rate_limiter, ua_rotator)
         with pytest.raises(RuntimeError, match="not initialized"):
             await client.fetch("https://example.com/test")
+
+    @pytest.mark.asyncio
+    async def test_pool_keeps_http2_connections_alive(self, rate_limiter, ua_rotator):
+        async with HttpClient(rate_limiter, ua_rotator, keepalive_expiry=60.0) as client:
+            pool = client._require_client()._transport._pool
+            assert pool._http2 is True
+            assert pool._keepalive_expiry == 60.0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_nested_context_keeps_client_open(self, rate_limiter, ua_rotator):
+        respx.get("https://example.com/test").mock(return_value=httpx.Response(200, text="ok"))
+        async with HttpClient(rate_limiter, ua_rotator) as client:
+            async with client:
+                pass
+            result = await client.fetch("https://example.com/test")
+            assert result.success is True
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await client.fetch("https://example.com/test")
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_unmatched_exit_does_not_break_depth(self, rate_limiter, ua_rotator):
+        respx.get("https://example.com/test").mock(return_value=httpx.Response(200, text="ok"))
+        client = HttpClient(rate_limiter, ua_rotator)
+        await client.__aexit__(None, None, None)
+        async with client:
+            assert (await client.fetch("https://example.com/test")).success is True
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await client.fetch("https://example.com/test")
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_fetch_many(self, rate_limiter, ua_rotator):
+        respx.get("https://example.com/a").mock(return_value=httpx.Response(200, text="A"))
+        respx.get("https://example.com/b").mock(return_value=httpx.Response(200, text="B"))
+        async with HttpClient(rate_limiter, ua_rotator) as client:
+            results = await client.fetch_many(["https://example.com/a", "https://example.com/b"])
+        assert [r.text for r in results] == ["A", "B"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_fetch_many_bounded(self, rate_limiter, ua_rotator):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, text=request.url.path)
+
+        respx.get(url__startswith="https://example.com/").mock(side_effect=handler)
+        urls = [f"https://example.com/{i}" for i in range(10)]
+        async with HttpClient(rate_limiter, ua_rotator) as client:
+            results = await client.fetch_many(urls, max_concurrency=3)
+        assert [r.text for r in results] == [f"/{i}" for i in range(10)]
+        assert peak <= 3
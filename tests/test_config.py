@@ -41,6 +41,7 @@ class TestLoadConfig:
         assert config.rate_limit.burst == 5
         assert config.retry.max_attempts == 3
         assert config.retry.backoff_base == 1.0
+        assert config.concurrency.max_inflight == 64
         assert config.export.format == "json"
         assert config.urls == []
         assert config.headers == {}
@@ -65,3 +66,14 @@ class TestLoadConfigFromDict:
     def test_missing_base_url(self):
         with pytest.raises(ConfigError, match="base_url"):
             load_config_from_dict({"name": "test"})
+
+    def test_unknown_nested_keys_ignored(self):
+        config = load_config_from_dict(
+            {
+                "name": "test",
+                "base_url": "https://example.com",
+                "retry": {"max_attempts": 5, "unknown": True},
+            }
+        )
+        assert config.retry.max_attempts == 5
+        assert config.retry.backoff_base == 1.0
@@ -0,0 +1,194 @@
+"""Tests for the cached async DNS resolver."""
+
+import asyncio
+import socket
+import time
+
+import httpcore
+import httpx
+import pytest
+
+from webscrape import dns
+from webscrape.client import HttpClient
+from webscrape.dns import CachedResolver, CachedResolverTransport, shared_resolver
+from webscrape.ratelimit import RateLimiter
+
+
+@pytest.fixture
+async def calls(monkeypatch):
+    """Replace the running loop's getaddrinfo with a counting fake."""
+    calls: list[str] = []
+
+    async def fake_getaddrinfo(host, port, **kwargs):
+        calls.append(host)
+        await asyncio.sleep(0)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.1", 0))]
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", fake_getaddrinfo)
+    return calls
+
+
+class TestCachedResolver:
+    @pytest.mark.asyncio
+    async def test_resolve_returns_addresses(self, calls):
+        resolver = CachedResolver()
+        assert await resolver.resolve("example.com") == ["192.0.2.1"]
+        assert calls == ["example.com"]
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_lookup(self, calls):
+        resolver = CachedResolver()
+        await resolver.resolve("example.com")
+        await resolver.resolve("example.com")
+        assert calls == ["example.com"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_coalesce(self, calls):
+        resolver = CachedResolver()
+        results = await asyncio.gather(*(resolver.resolve("example.com") for _ in range(10)))
+        assert all(r == ["192.0.2.1"] for r in results)
+        assert calls == ["example.com"]
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refreshed(self, calls):
+        resolver = CachedResolver(ttl=0.0)
+        await resolver.resolve("example.com")
+        await resolver.resolve("example.com")
+        assert calls == ["example.com", "example.com"]
+
+    @pytest.mark.asyncio
+    async def test_size_bound_evicts_oldest(self, calls):
+        resolver = CachedResolver(max_hosts=2)
+        for host in ("a.com", "b.com", "c.com"):
+            await resolver.resolve(host)
+        assert len(resolver) == 2
+        await resolver.resolve("a.com")
+        assert calls == ["a.com", "b.com", "c.com", "a.com"]
+
+    def test_pending_lookup_from_another_loop_is_ignored(self, monkeypatch):
+        async def fake_lookup(self, host):
+            return ["192.0.2.1"]
+
+        monkeypatch.setattr(CachedResolver, "_lookup", fake_lookup)
+        resolver = CachedResolver()
+        stale_loop = asyncio.new_event_loop()
+        resolver._pending["example.com"] = stale_loop.create_future()
+        stale_loop.close()
+        assert asyncio.run(resolver.resolve("example.com")) == ["192.0.2.1"]
+
+
+def test_http_clients_share_process_wide_resolver():
+    limiter = RateLimiter()
+    assert HttpClient(limiter).resolver is HttpClient(limiter).resolver is shared_resolver()
+    own = CachedResolver()
+    assert HttpClient(limiter, resolver=own).resolver is own
+
+
+class _FakeStream:
+    closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+class _FakeBackend:
+    """Network backend whose connect outcome is scripted per address."""
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+        self.attempts = []
+        self.streams = []
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.attempts.append(host)
+        outcome = self.outcomes[host]
+        if outcome == "hang":
+            await asyncio.sleep(3600)
+        if outcome == "timeout":
+            raise httpcore.ConnectTimeout(f"timed out connecting to {host}")
+        if outcome == "refuse":
+            raise httpcore.ConnectError(f"refused by {host}")
+        stream = _FakeStream()
+        self.streams.append(stream)
+        return stream
+
+
+def _backend_for(addresses, outcomes):
+    """A _ResolvingBackend over a fake backend, with addresses already resolved."""
+    resolver = CachedResolver()
+
+    async def resolve(host):
+        return addresses
+
+    resolver.resolve = resolve
+    fake = _FakeBackend(outcomes)
+    return dns._ResolvingBackend(fake, resolver), fake
+
+
+class TestResolvingBackend:
+    @pytest.fixture(autouse=True)
+    def short_head_start(self, monkeypatch):
+        monkeypatch.setattr(dns, "_HAPPY_EYEBALLS_DELAY", 0.01)
+
+    @pytest.mark.asyncio
+    async def test_timeout_on_first_address_tries_the_next(self):
+        backend, fake = _backend_for(
+            ["2001:db8::1", "127.0.0.1"], {"2001:db8::1": "timeout", "127.0.0.1": "ok"}
+        )
+        stream = await backend.connect_tcp("example.com", 80, timeout=5.0)
+        assert stream is fake.streams[0]
+        assert fake.attempts == ["2001:db8::1", "127.0.0.1"]
+
+    @pytest.mark.asyncio
+    async def test_hanging_address_is_raced_after_head_start(self):
+        backend, fake = _backend_for(
+            ["2001:db8::1", "127.0.0.1"], {"2001:db8::1": "hang", "127.0.0.1": "ok"}
+        )
+        start = time.monotonic()
+        stream = await backend.connect_tcp("example.com", 80, timeout=5.0)
+        assert stream is fake.streams[0]
+        assert time.monotonic() - start < 1.0
+
+    @pytest.mark.asyncio
+    async def test_attempts_share_one_deadline(self):
+        backend, fake = _backend_for(
+            ["2001:db8::1", "127.0.0.1"], {"2001:db8::1": "hang", "127.0.0.1": "hang"}
+        )
+        start = time.monotonic()
+        with pytest.raises(httpcore.ConnectTimeout):
+            await backend.connect_tcp("example.com", 80, timeout=0.1)
+        assert time.monotonic() - start < 0.5
+        assert fake.attempts == ["2001:db8::1", "127.0.0.1"]
+
+    @pytest.mark.asyncio
+    async def test_address_families_interleaved(self):
+        backend, fake = _backend_for(
+            ["2001:db8::1", "2001:db8::2", "192.0.2.1"],
+            {"2001:db8::1": "refuse", "2001:db8::2": "refuse", "192.0.2.1": "refuse"},
+        )
+        with pytest.raises(httpcore.ConnectError):
+            await backend.connect_tcp("example.com", 80, timeout=5.0)
+        assert fake.attempts == ["2001:db8::1", "192.0.2.1", "2001:db8::2"]
+
+
+@pytest.mark.asyncio
+async def test_transport_connects_through_cached_resolver(monkeypatch):
+    async def respond(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok")
+        await writer.drain()
+        writer.close()
+
+    async def fake_getaddrinfo(host, port, **kwargs):
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", 0))]
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", fake_getaddrinfo)
+    server = await asyncio.start_server(respond, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    resolver = CachedResolver()
+    transport = CachedResolverTransport(resolver)
+    assert isinstance(transport._pool._network_backend, dns._ResolvingBackend)
+    async with server, httpx.AsyncClient(transport=transport) as client:
+        response = await client.get(f"http://shop.test:{port}/")
+    assert response.text == "ok"
+    assert len(resolver) == 1
@@ -4,8 +4,11 @@ import csv
 import json
 import sqlite3
 
+import pytest
+
 from webscrape.export.csv_export import CsvExporter
 from webscrape.export.json_export import JsonExporter
+from webscrape.export.jsonl_export import JsonlExporter
 from webscrape.export.sqlite_export import SqliteExporter
 
 SAMPLE_DATA = [
@@ -37,6 +40,46 @@ class TestJsonExporter:
             loaded = json.load(f)
         assert len(loaded) == 3
 
+    def test_non_ascii_written_as_utf8(self, tmp_path):
+        output = tmp_path / "unicode.json"
+        JsonExporter().export([{"title": "Café ünïcode"}], str(output))
+        assert "Café ünïcode" in output.read_text(encoding="utf-8")
+
+    def test_streamed_batches(self, tmp_path):
+        output = str(tmp_path / "stream.json")
+        exporter = JsonExporter()
+        exporter.open(output)
+        exporter.write_rows(SAMPLE_DATA[:1])
+        exporter.write_rows([])
+        exporter.write_rows(SAMPLE_DATA[1:])
+        exporter.close()
+        with open(output) as f:
+            assert json.load(f) == SAMPLE_DATA
+
+    def test_failed_export_left_unterminated(self, tmp_path):
+        output = tmp_path / "failed.json"
+        with pytest.raises(TypeError):
+            JsonExporter().export([{"title": "First"}, {"title": {1, 2}}], str(output))
+        with pytest.raises(json.JSONDecodeError):
+            json.loads(output.read_text())
+
+    def test_write_before_open_raises(self):
+        with pytest.raises(RuntimeError, match="open"):
+            JsonExporter().write_rows(SAMPLE_DATA)
+
+
+class TestJsonlExporter:
+    def test_export_and_read(self, tmp_path):
+        output = tmp_path / "test.jsonl"
+        JsonlExporter().export(SAMPLE_DATA, str(output))
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == SAMPLE_DATA
+
+    def test_empty_data(self, tmp_path):
+        output = tmp_path / "empty.jsonl"
+        JsonlExporter().export([], str(output))
+        assert output.read_text() == ""
+
 
 class TestCsvExporter:
     def test_export_and_read(self, tmp_path):
@@ -62,6 +105,25 @@ class TestCsvExporter:
             reader = csv.DictReader(f)
             assert len(list(reader)) == 3
 
+    def test_single_column_and_missing_keys(self, tmp_path):
+        output = str(tmp_path / "single.csv")
+        CsvExporter().export([{"title": "First"}, {}], output)
+        with open(output, newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows == [["title"], ["First"], [""]]
+
+    def test_streamed_batches_write_header_once(self, tmp_path):
+        output = str(tmp_path / "stream.csv")
+        exporter = CsvExporter()
+        exporter.open(output)
+        exporter.write_rows([])
+        exporter.write_rows(SAMPLE_DATA[:2])
+        exporter.write_rows(SAMPLE_DATA[2:])
+        exporter.close()
+        with open(output, newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows == [["title", "url"], ["First", "/1"], ["Second", "/2"], ["Third", "/3"]]
+
 
 class TestSqliteExporter:
     def test_export_and_read(self, tmp_path):
@@ -89,3 +151,48 @@ class TestSqliteExporter:
         rows = conn.execute("SELECT * FROM items").fetchall()
         conn.close()
         assert len(rows) == 3
+
+    def test_missing_keys_default_to_empty(self, tmp_path):
+        output = str(tmp_path / "partial.db")
+        SqliteExporter().export([{"title": "First", "url": "/1"}, {"title": "Second"}], output)
+        conn = sqlite3.connect(output)
+        rows = conn.execute("SELECT title, url FROM scraped_data").fetchall()
+        conn.close()
+        assert rows == [("First", "/1"), ("Second", "")]
+
+    def test_streamed_batches(self, tmp_path):
+        output = str(tmp_path / "stream.db")
+        exporter = SqliteExporter()
+        exporter.open(output)
+        exporter.write_rows(SAMPLE_DATA[:1])
+        exporter.write_rows(SAMPLE_DATA[1:])
+        exporter.close()
+        conn = sqlite3.connect(output)
+        rows = conn.execute("SELECT title FROM scraped_data").fetchall()
+        conn.close()
+        assert rows == [("First",), ("Second",), ("Third",)]
+
+    def test_failed_export_rolled_back(self, tmp_path):
+        output = str(tmp_path / "failed.db")
+        with pytest.raises(sqlite3.ProgrammingError):
+            SqliteExporter().export([{"title": "First"}, {"title": {"nested": "x"}}], output)
+        conn = sqlite3.connect(output)
+        tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+        conn.close()
+        assert tables == []
+
+    def test_output_not_left_in_wal_mode(self, tmp_path):
+        output = str(tmp_path / "journal.db")
+        SqliteExporter().export(SAMPLE_DATA, output)
+        conn = sqlite3.connect(output)
+        mode = conn.execute("PRAGMA journal_mode").fetchone()
+        conn.close()
+        assert mode == ("delete",)
+
+    def test_quotes_in_column_names(self, tmp_path):
+        output = str(tmp_path / "quoted.db")
+        SqliteExporter().export([{'say "hi"': "hello"}], output)
+        conn = sqlite3.connect(output)
+        rows = conn.execute('SELECT "say ""hi""" FROM scraped_data').fetchall()
+        conn.close()
+        assert rows == [("hello",)]
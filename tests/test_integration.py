@@ -3,6 +3,8 @@
 import csv
 import json
 import sqlite3
+from dataclasses import replace
+from functools import cache
 
 import httpx
 import pytest
@@ -40,8 +42,9 @@ INTEGRATION_HTML_PAGE2 = """<!DOCTYPE html>
 </body></html>"""
 
 
-def _make_config(tmp_path, fmt="json", pagination=False):
-    output_ext = {"json": "json", "csv": "csv", "sqlite": "db"}[fmt]
+@cache
+def _validated_config(fmt, pagination):
+    """Validate each format/pagination combination once; tests only swap the output path."""
     return load_config_from_dict(
         {
             "name": "integration-test",
@@ -63,17 +66,32 @@ def _make_config(tmp_path, fmt="json", pagination=False):
             },
             "rate_limit": {"requests_per_second": 100, "burst": 100},
             "retry": {"max_attempts": 1, "backoff_base": 0.01, "backoff_max": 0.01},
-            "export": {"format": fmt, "output": str(tmp_path / f"result.{output_ext}")},
+            "export": {"format": fmt},
         }
     )
 
 
+def _make_config(tmp_path, fmt="json", pagination=False):
+    output_ext = {"json": "json", "csv": "csv", "sqlite": "db"}[fmt]
+    config = _validated_config(fmt, pagination)
+    export = replace(config.export, output=str(tmp_path / f"result.{output_ext}"))
+    return replace(config, export=export)
+
+
+@pytest.fixture
+def router():
+    """Mock the shop for one test; robots.txt is a 404 unless a test overrides the route."""
+    with respx.mock(assert_all_called=False) as router:
+        router.get("https://shop.example.com/robots.txt", name="robots").mock(
+            return_value=httpx.Response(404)
+        )
+        yield router
+
+
 class TestEndToEndJson:
     @pytest.mark.asyncio
-    @respx.mock
-    async def test_scrape_to_json(self, tmp_path):
-        respx.get("https://shop.example.com/robots.txt").mock(return_value=httpx.Response(404))
-        respx.get("https://shop.example.com/items?page=1").mock(
+    async def test_scrape_to_json(self, router, tmp_path):
+        router.get("https://shop.example.com/items?page=1").mock(
             return_value=httpx.Response(200, text=INTEGRATION_HTML)
         )
         config = _make_config(tmp_path, fmt="json")
@@ -89,10 +107,8 @@ class TestEndToEndJson:
 
 class TestEndToEndCsv:
     @pytest.mark.asyncio
-    @respx.mock
-    async def test_scrape_to_csv(self, tmp_path):
-        respx.get("https://shop.example.com/robots.txt").mock(return_value=httpx.Response(404))
-        respx.get("https://shop.example.com/items?page=1").mock(
+    async def test_scrape_to_csv(self, router, tmp_path):
+        router.get("https://shop.example.com/items?page=1").mock(
             return_value=httpx.Response(200, text=INTEGRATION_HTML)
         )
         config = _make_config(tmp_path, fmt="csv")
@@ -106,10 +122,8 @@ class TestEndToEndCsv:
 
 class TestEndToEndSqlite:
     @pytest.mark.asyncio
-    @respx.mock
-    async def test_scrape_to_sqlite(self, tmp_path):
-        respx.get("https://shop.example.com/robots.txt").mock(return_value=httpx.Response(404))
-        respx.get("https://shop.example.com/items?page=1").mock(
+    async def test_scrape_to_sqlite(self, router, tmp_path):
+        router.get("https://shop.example.com/items?page=1").mock(
             return_value=httpx.Response(200, text=INTEGRATION_HTML)
         )
         config = _make_config(tmp_path, fmt="sqlite")
@@ -125,13 +139,11 @@ class TestEndToEndSqlite:
 
 class TestEndToEndPagination:
     @pytest.mark.asyncio
-    @respx.mock
-    async def test_pagination_follows_links(self, tmp_path):
-        respx.get("https://shop.example.com/robots.txt").mock(return_value=httpx.Response(404))
-        respx.get("https://shop.example.com/items?page=1").mock(
+    async def test_pagination_follows_links(self, router, tmp_path):
+        router.get("https://shop.example.com/items?page=1").mock(
             return_value=httpx.Response(200, text=INTEGRATION_HTML)
         )
-        respx.get("https://shop.example.com/items?page=2").mock(
+        router.get("https://shop.example.com/items?page=2").mock(
             return_value=httpx.Response(200, text=INTEGRATION_HTML_PAGE2)
         )
         config = _make_config(tmp_path, fmt="json", pagination=True)
@@ -147,9 +159,8 @@ class TestEndToEndPagination:
 
 class TestEndToEndRobotsBlocked:
     @pytest.mark.asyncio
-    @respx.mock
-    async def test_robots_blocks_scrape(self, tmp_path):
-        respx.get("https://shop.example.com/robots.txt").mock(
+    async def test_robots_blocks_scrape(self, router, tmp_path):
+        router.get("https://shop.example.com/robots.txt").mock(
             return_value=httpx.Response(200, text="User-agent: *\nDisallow: /items\n")
         )
         config = _make_config(tmp_path, fmt="json")
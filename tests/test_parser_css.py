@@ -13,35 +13,71 @@ class TestCssParser:
             "date": "time.date::attr(datetime)",
         }
 
-    def test_extract_items(self, sample_html):
-        results = self.parser.parse(sample_html, "article.item", self.fields)
+    def test_extract_items(self, sample_css_tree):
+        results = self.parser.extract_items(sample_css_tree, "article.item", self.fields)
         assert len(results) == 3
         assert results[0]["title"] == "First Item"
         assert results[1]["title"] == "Second Item"
         assert results[2]["title"] == "Third Item"
 
-    def test_extract_text(self, sample_html):
-        results = self.parser.parse(sample_html, "article.item", self.fields)
+    def test_extract_text(self, sample_css_tree):
+        results = self.parser.extract_items(sample_css_tree, "article.item", self.fields)
         assert results[0]["summary"] == "Summary of first item"
 
-    def test_extract_attr(self, sample_html):
-        results = self.parser.parse(sample_html, "article.item", self.fields)
+    def test_extract_attr(self, sample_css_tree):
+        results = self.parser.extract_items(sample_css_tree, "article.item", self.fields)
         assert results[0]["url"] == "/item/1"
         assert results[0]["date"] == "2025-01-15"
 
-    def test_missing_elements_return_empty(self, sample_html):
+    def test_missing_elements_return_empty(self, sample_css_tree):
         fields = {"missing": "span.nonexistent::text"}
-        results = self.parser.parse(sample_html, "article.item", fields)
+        results = self.parser.extract_items(sample_css_tree, "article.item", fields)
         assert results[0]["missing"] == ""
 
     def test_select_one(self, sample_html):
         result = self.parser.select_one(sample_html, "a.next-page::attr(href)")
         assert result == "/page/2"
 
-    def test_select_one_text(self, sample_html):
-        result = self.parser.select_one(sample_html, "a.next-page::text")
+    def test_select_one_text(self, sample_css_tree):
+        result = self.parser.select_one_doc(sample_css_tree, "a.next-page::text")
         assert result == "Next"
 
-    def test_plain_selector(self, sample_html):
-        results = self.parser.parse(sample_html, "article.item", {"title": "h2.title"})
+    def test_plain_selector(self, sample_css_tree):
+        results = self.parser.extract_items(sample_css_tree, "article.item", {"title": "h2.title"})
         assert results[0]["title"] == "First Item"
+
+    def test_field_selector_does_not_match_item_itself(self):
+        html = '<div class="item"><div class="item"><span>inner</span></div></div>'
+        results = self.parser.parse(html, "body > div.item", {"inner": "div.item::text"})
+        assert results == [{"inner": "inner"}]
+
+    def test_compiled_parser_reused_across_pages(self, sample_html, sample_html_page2):
+        compiled = self.parser.compile("article.item", self.fields)
+        assert [r["title"] for r in compiled.parse(sample_html)] == [
+            "First Item",
+            "Second Item",
+            "Third Item",
+        ]
+        assert compiled.parse(sample_html_page2)[0]["url"] == "/item/4"
+
+    def test_select_one_missing(self, sample_css_tree):
+        assert self.parser.select_one_doc(sample_css_tree, "span.nonexistent::text") is None
+
+    def test_shared_document_for_items_and_next_link(self, sample_html):
+        doc = self.parser.parse_document(sample_html)
+        compiled = self.parser.compile("article.item", self.fields)
+        assert len(compiled.extract_items(doc)) == 3
+        assert self.parser.select_one_doc(doc, "a.next-page::attr(href)") == "/page/2"
+
+    def test_compile_is_memoized_per_selector_set(self):
+        compiled = self.parser.compile("article.item", self.fields)
+        assert self.parser.compile("article.item", dict(self.fields)) is compiled
+        assert self.parser.compile("div.item", self.fields) is not compiled
+
+    def test_compiled_selector(self, sample_html):
+        selector = self.parser.compile_selector("a.next-page::attr(href)")
+        assert self.parser.select_one(sample_html, selector) == "/page/2"
+
+    def test_parses_utf8_bytes(self):
+        html = '<article class="item"><h2 class="title">Café</h2></article>'.encode()
+        assert self.parser.parse(html, "article.item", self.fields)[0]["title"] == "Café"
@@ -12,31 +12,61 @@ class TestXPathParser:
             "date": ".//time[@class='date']/@datetime",
         }
 
-    def test_extract_items(self, sample_html):
-        results = self.parser.parse(sample_html, "//article[@class='item']", self.fields)
+    def test_extract_items(self, sample_xpath_tree):
+        results = self.parser.extract_items(
+            sample_xpath_tree, "//article[@class='item']", self.fields
+        )
         assert len(results) == 3
         assert results[0]["title"] == "First Item"
         assert results[1]["title"] == "Second Item"
         assert results[2]["title"] == "Third Item"
 
-    def test_extract_attribute(self, sample_html):
-        results = self.parser.parse(sample_html, "//article[@class='item']", self.fields)
+    def test_extract_attribute(self, sample_xpath_tree):
+        results = self.parser.extract_items(
+            sample_xpath_tree, "//article[@class='item']", self.fields
+        )
         assert results[0]["url"] == "/item/1"
         assert results[0]["date"] == "2025-01-15"
 
-    def test_missing_elements(self, sample_html):
+    def test_missing_elements(self, sample_xpath_tree):
         fields = {"missing": ".//span[@class='nonexistent']/text()"}
-        results = self.parser.parse(sample_html, "//article[@class='item']", fields)
+        results = self.parser.extract_items(sample_xpath_tree, "//article[@class='item']", fields)
         assert results[0]["missing"] == ""
 
     def test_select_one(self, sample_html):
         result = self.parser.select_one(sample_html, "//a[@class='next-page']/@href")
         assert result == "/page/2"
 
-    def test_select_one_text(self, sample_html):
-        result = self.parser.select_one(sample_html, "//a[@class='next-page']/text()")
+    def test_select_one_text(self, sample_xpath_tree):
+        result = self.parser.select_one_doc(sample_xpath_tree, "//a[@class='next-page']/text()")
         assert result == "Next"
 
-    def test_select_one_missing(self, sample_html):
-        result = self.parser.select_one(sample_html, "//span[@class='nonexistent']/text()")
+    def test_select_one_missing(self, sample_xpath_tree):
+        result = self.parser.select_one_doc(
+            sample_xpath_tree, "//span[@class='nonexistent']/text()"
+        )
         assert result is None
+
+    def test_compiled_parser_reused_across_pages(self, sample_html, sample_html_page2):
+        compiled = self.parser.compile("//article[@class='item']", self.fields)
+        assert len(compiled.parse(sample_html)) == 3
+        assert compiled.parse(sample_html_page2)[0]["url"] == "/item/4"
+
+    def test_shared_document_for_items_and_next_link(self, sample_html):
+        doc = self.parser.parse_document(sample_html)
+        compiled = self.parser.compile("//article[@class='item']", self.fields)
+        assert len(compiled.extract_items(doc)) == 3
+        assert self.parser.select_one_doc(doc, "//a[@class='next-page']/@href") == "/page/2"
+
+    def test_empty_document(self):
+        assert self.parser.parse("", "//article", self.fields) == []
+        assert self.parser.select_one("", "//a/@href") is None
+
+    def test_compiled_selector(self, sample_html):
+        selector = self.parser.compile_selector("//a[@class='next-page']/@href")
+        assert self.parser.select_one(sample_html, selector) == "/page/2"
+
+    def test_parses_utf8_bytes(self):
+        html = "<article class='item'><h2 class='title'>Café</h2></article>".encode()
+        results = self.parser.parse(html, "//article[@class='item']", self.fields)
+        assert results[0]["title"] == "Café"
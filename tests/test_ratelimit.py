@@ -38,6 +38,14 @@ class TestTokenBucket:
         elapsed = time.monotonic() - start
         assert elapsed < 0.1
 
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_are_spaced(self):
+        bucket = TokenBucket(rate=20.0, burst=1)
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+        elapsed = time.monotonic() - start
+        assert 0.14 <= elapsed < 0.5
+
 
 class TestRateLimiter:
     @pytest.mark.asyncio
@@ -63,3 +71,9 @@ class TestRateLimiter:
         limiter.set_domain_rate("example.com", 10.0)
         bucket = limiter.get_bucket("https://example.com/test")
         assert bucket.rate == 10.0
+
+    def test_domain_ignores_path_query_and_fragment(self):
+        limiter = RateLimiter()
+        bucket = limiter.get_bucket("https://example.com:8080/a?b=/c#d")
+        assert limiter.get_bucket("https://example.com:8080?x=1") is bucket
+        assert limiter.get_bucket("https://example.com/a") is not bucket
@@ -1,20 +1,29 @@
 """Tests for retry logic with exponential backoff."""
 
+import pytest
+
 from webscrape.retry import (
     calculate_backoff,
     get_retry_after,
     is_retryable_status,
 )
 
+_RETRY_AFTER_CASES = [
+    ({"Retry-After": "5"}, 5.0),
+    ({"retry-after": "10"}, 10.0),
+    ({}, None),
+    ({"Retry-After": "not-a-number"}, None),
+]
+
 
 class TestIsRetryableStatus:
-    def test_retryable_codes(self):
-        for code in [429, 500, 502, 503, 504]:
-            assert is_retryable_status(code) is True
+    @pytest.mark.parametrize("code", [429, 500, 502, 503, 504])
+    def test_retryable_codes(self, code):
+        assert is_retryable_status(code) is True
 
-    def test_non_retryable_codes(self):
-        for code in [200, 201, 400, 401, 403, 404]:
-            assert is_retryable_status(code) is False
+    @pytest.mark.parametrize("code", [200, 201, 400, 401, 403, 404])
+    def test_non_retryable_codes(self, code):
+        assert is_retryable_status(code) is False
 
 
 class TestCalculateBackoff:
@@ -29,20 +38,16 @@ class TestCalculateBackoff:
         assert delay <= 30.0
 
     def test_jitter_within_range(self):
-        for _ in range(100):
-            delay = calculate_backoff(0, backoff_base=1.0, backoff_max=100.0)
-            assert 1.0 <= delay <= 2.0
+        delays = [calculate_backoff(0, backoff_base=1.0, backoff_max=100.0) for _ in range(100)]
+        assert min(delays) >= 1.0
+        assert max(delays) <= 2.0
 
 
 class TestGetRetryAfter:
-    def test_numeric_value(self):
-        assert get_retry_after({"Retry-After": "5"}) == 5.0
-
-    def test_lowercase_header(self):
-        assert get_retry_after({"retry-after": "10"}) == 10.0
-
-    def test_missing_header(self):
-        assert get_retry_after({}) is None
-
-    def test_invalid_value(self):
-        assert get_retry_after({"Retry-After": "not-a-number"}) is None
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        _RETRY_AFTER_CASES,
+        ids=["numeric", "lowercase", "missing", "invalid"],
+    )
+    def test_get_retry_after(self, headers, expected):
+        assert get_retry_after(headers) == expected
@@ -4,49 +4,54 @@ import httpx
 import pytest
 import respx
 
+from webscrape.client import HttpClient
+from webscrape.ratelimit import RateLimiter
 from webscrape.robots import RobotsChecker
 
+PRIVATE_ONLY = "User-agent: *\nDisallow: /private/"
+
+
+@pytest.fixture
+async def http_client():
+    async with HttpClient(RateLimiter(default_rate=100.0, default_burst=100)) as client:
+        yield client
+
 
 class TestRobotsChecker:
-    def test_allowed_path(self):
-        checker = RobotsChecker()
-        checker.set_robots_txt(
-            "example.com",
-            "User-agent: *\nAllow: /\nDisallow: /private/",
+    def test_allowed_path(self, robots_checker_factory):
+        checker = robots_checker_factory(
+            "example.com", "User-agent: *\nAllow: /\nDisallow: /private/"
         )
         assert checker.is_allowed("https://example.com/public/page") is True
 
-    def test_disallowed_path(self):
-        checker = RobotsChecker()
-        checker.set_robots_txt(
-            "example.com",
-            "User-agent: *\nDisallow: /private/",
-        )
+    def test_disallowed_path(self, robots_checker_factory):
+        checker = robots_checker_factory("example.com", PRIVATE_ONLY)
         assert checker.is_allowed("https://example.com/private/secret") is False
 
     def test_missing_robots_allows_all(self):
         checker = RobotsChecker()
         assert checker.is_allowed("https://example.com/anything") is True
 
-    def test_crawl_delay_parsing(self):
-        checker = RobotsChecker()
-        checker.set_robots_txt(
-            "example.com",
-            "User-agent: *\nCrawl-delay: 5\nDisallow: /admin/",
+    def test_crawl_delay_parsing(self, robots_checker_factory):
+        checker = robots_checker_factory(
+            "example.com", "User-agent: *\nCrawl-delay: 5\nDisallow: /admin/"
         )
         assert checker.get_crawl_delay("https://example.com/page") == 5
 
-    def test_no_crawl_delay(self):
-        checker = RobotsChecker()
-        checker.set_robots_txt(
-            "example.com",
-            "User-agent: *\nDisallow: /private/",
-        )
+    def test_no_crawl_delay(self, robots_checker_factory):
+        checker = robots_checker_factory("example.com", PRIVATE_ONLY)
         assert checker.get_crawl_delay("https://example.com/page") is None
 
+    def test_cached_decision_refreshed_when_rules_change(self):
+        checker = RobotsChecker()
+        assert checker.is_allowed("https://example.com/private/a") is True
+        checker.set_robots_txt("example.com", PRIVATE_ONLY)
+        assert checker.is_allowed("https://example.com/private/a") is False
+        assert checker.is_allowed("https://example.com/private/a#frag") is False
+
     @pytest.mark.asyncio
     @respx.mock
-    async def test_fetch_robots_success(self):
+    async def test_fetch_robots_success(self, http_client):
         respx.get("https://example.com/robots.txt").mock(
             return_value=httpx.Response(
                 200,
@@ -54,25 +59,72 @@ class TestRobotsChecker:
             )
         )
         checker = RobotsChecker()
-        await checker.fetch_robots("https://example.com/page")
+        await checker.fetch_robots("https://example.com/page", http_client)
         assert checker.is_allowed("https://example.com/public") is True
         assert checker.is_allowed("https://example.com/secret/data") is False
 
     @pytest.mark.asyncio
     @respx.mock
-    async def test_fetch_robots_404_allows_all(self):
+    async def test_fetch_robots_404_allows_all(self, http_client):
         respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(404))
         checker = RobotsChecker()
-        await checker.fetch_robots("https://example.com/page")
+        await checker.fetch_robots("https://example.com/page", http_client)
         assert checker.is_allowed("https://example.com/anything") is True
 
     @pytest.mark.asyncio
     @respx.mock
-    async def test_fetch_robots_cached(self):
+    async def test_fetch_robots_cached(self, http_client):
         route = respx.get("https://example.com/robots.txt").mock(
             return_value=httpx.Response(200, text="User-agent: *\nDisallow:\n")
         )
         checker = RobotsChecker()
-        await checker.fetch_robots("https://example.com/page1")
-        await checker.fetch_robots("https://example.com/page2")
+        await checker.fetch_robots("https://example.com/page1", http_client)
+        await checker.fetch_robots("https://example.com/page2", http_client)
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_missing_robots_cached_until_ttl(self, http_client):
+        route = respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(410))
+        checker = RobotsChecker()
+        await checker.fetch_robots("https://example.com/a", http_client)
+        await checker.fetch_robots("https://example.com/b", http_client)
         assert route.call_count == 1
+        assert checker.is_allowed("https://example.com/anything") is True
+        assert checker.get_crawl_delay("https://example.com/a") is None
+
+        expired = RobotsChecker(ttl=0.0)
+        await expired.fetch_robots("https://example.com/a", http_client)
+        await expired.fetch_robots("https://example.com/b", http_client)
+        assert route.call_count == 3
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_connection_error_not_cached(self, http_client):
+        route = respx.get("https://example.com/robots.txt").mock(
+            side_effect=httpx.ConnectError("refused")
+        )
+        checker = RobotsChecker()
+        await checker.fetch_robots("https://example.com/a", http_client)
+        await checker.fetch_robots("https://example.com/a", http_client)
+        assert route.call_count == 2
+        assert checker.is_allowed("https://example.com/a") is True
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [401, 403])
+    @respx.mock
+    async def test_access_denied_allows_all(self, http_client, status):
+        respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(status))
+        checker = RobotsChecker()
+        await checker.fetch_robots("https://example.com/page", http_client)
+        assert checker.is_allowed("https://example.com/page") is True
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_server_error_allows_all_but_not_cached(self, http_client):
+        route = respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(503))
+        checker = RobotsChecker()
+        await checker.fetch_robots("https://example.com/a", http_client)
+        assert checker.is_allowed("https://example.com/a") is True
+        await checker.fetch_robots("https://example.com/a", http_client)
+        assert route.call_count == 2
@@ -1,15 +1,35 @@
 """Tests for core scraper with pagination and concurrency."""
 
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import is_dataclass, replace
+
 import httpx
 import pytest
+import pytest_asyncio
 import respx
 
+from webscrape import scraper as scraper_module
+from webscrape.client import HttpClient
 from webscrape.config import load_config_from_dict
-from webscrape.scraper import scrape
+from webscrape.export.json_export import JsonExporter
+from webscrape.ratelimit import RateLimiter
+from webscrape.robots import RobotsChecker
+from webscrape.scraper import run_sync, scrape
 
+_HTML_HEADERS = {"content-type": "text/html; charset=utf-8"}
 
-def _make_config(**overrides):
-    base = {
+
+def _html_response(body: bytes) -> httpx.Response:
+    """Build a mock page response from pre-encoded bytes, so nothing is re-encoded per call."""
+    return httpx.Response(200, content=body, headers=_HTML_HEADERS)
+
+
+_BASE_CONFIG = load_config_from_dict(
+    {
         "name": "test",
         "base_url": "https://example.com",
         "urls": ["https://example.com/page/1"],
@@ -23,86 +43,410 @@ def _make_config(**overrides):
         },
         "rate_limit": {"requests_per_second": 100, "burst": 100},
         "retry": {"max_attempts": 1, "backoff_base": 0.01, "backoff_max": 0.01},
-        "export": {"format": "json", "output": "./output/test.json"},
+        # Most tests never read the export back; their output is discarded.
+        "export": {"format": "json", "output": os.devnull},
     }
-    base.update(overrides)
-    return load_config_from_dict(base)
+)
+
+
+def _make_config(**overrides):
+    """Copy the base config; dict overrides update the matching nested section."""
+    changes = {}
+    for key, value in overrides.items():
+        section = getattr(_BASE_CONFIG, key)
+        changes[key] = replace(section, **value) if is_dataclass(section) else value
+    return replace(_BASE_CONFIG, **changes)
+
+
+class _RecordingExporter:
+    """In-memory exporter that records what the scraper wrote and how it finished."""
+
+    def __init__(self):
+        self.rows = []
+        self.closed = False
+        self.aborted = False
+
+    def open(self, output_path):
+        pass
+
+    def write_rows(self, rows):
+        self.rows.extend(rows)
+
+    def close(self):
+        self.closed = True
+
+    def abort(self):
+        self.aborted = True
+
+
+class _BrokenPool:
+    """Stands in for a process pool whose worker has died."""
+
+    shut_down = False
+
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("A child process terminated abruptly")
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shut_down = True
+
+
+@pytest.fixture(scope="module")
+def module_router():
+    """One respx router per module, with the usual "no robots.txt" route installed once."""
+    with respx.mock(assert_all_called=False) as router:
+        router.get("https://example.com/robots.txt", name="robots").mock(
+            return_value=httpx.Response(404)
+        )
+        yield router
+
+
+@pytest.fixture
+def router(module_router):
+    """The module router, with routes and call history added by a test rolled back after it."""
+    module_router.snapshot()
+    yield module_router
+    module_router.rollback()
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def module_client():
+    """One HttpClient, and so one connection pool, for every scrape in the module."""
+    client = HttpClient(
+        RateLimiter(default_rate=100.0, default_burst=100),
+        max_attempts=1,
+        backoff_base=0.01,
+        backoff_max=0.01,
+    )
+    async with client:
+        yield client
+
+
+@pytest.fixture
+def shared_client(module_client, monkeypatch):
+    """The module client with a fresh rate limiter, so no limiter state leaks between tests."""
+    monkeypatch.setattr(
+        module_client, "_rate_limiter", RateLimiter(default_rate=100.0, default_burst=100)
+    )
+    return module_client
+
+
+@pytest.mark.asyncio(loop_scope="module")
 class TestScraper:
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_basic_scrape(self, sample_html, tmp_path):
-        respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(404))
-        respx.get("https://example.com/page/1").mock(
-            return_value=httpx.Response(200, text=sample_html)
-        )
-        output = str(tmp_path / "out.json")
-        config = _make_config(export={"format": "json", "output": output})
-        result = await scrape(config)
+    async def test_basic_scrape(self, router, shared_client, sample_html_bytes):
+        router.get("https://example.com/page/1").mock(
+            return_value=_html_response(sample_html_bytes)
+        )
+        config = _make_config()
+        result = await scrape(config, client=shared_client)
         assert result.urls_scraped == 1
         assert result.items_found == 3
         assert result.errors == 0
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_pagination(self, sample_html, sample_html_page2, tmp_path):
-        respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(404))
-        respx.get("https://example.com/page/1").mock(
-            return_value=httpx.Response(200, text=sample_html)
+    async def test_pagination(
+        self, router, shared_client, sample_html_bytes, sample_html_page2_bytes
+    ):
+        router.get("https://example.com/page/1").mock(
+            return_value=_html_response(sample_html_bytes)
         )
-        respx.get("https://example.com/page/2").mock(
-            return_value=httpx.Response(200, text=sample_html_page2)
+        router.get("https://example.com/page/2").mock(
+            return_value=_html_response(sample_html_page2_bytes)
         )
-        output = str(tmp_path / "out.json")
         config = _make_config(
             pagination={
                 "enabled": True,
                 "next_selector": "a.next-page::attr(href)",
                 "max_pages": 5,
             },
-            export={"format": "json", "output": output},
         )
-        result = await scrape(config)
+        result = await scrape(config, client=shared_client)
         assert result.urls_scraped == 2
         assert result.items_found == 4
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_robots_blocks_url(self, tmp_path):
-        respx.get("https://example.com/robots.txt").mock(
+    async def test_robots_blocks_url(self, router, shared_client):
+        router.get("https://example.com/robots.txt").mock(
             return_value=httpx.Response(200, text="User-agent: *\nDisallow: /page/\n")
         )
-        output = str(tmp_path / "out.json")
-        config = _make_config(export={"format": "json", "output": output})
-        result = await scrape(config)
+        config = _make_config()
+        result = await scrape(config, client=shared_client)
         assert result.urls_scraped == 0
         assert result.items_found == 0
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_fetch_failure(self, tmp_path):
-        respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(404))
-        respx.get("https://example.com/page/1").mock(return_value=httpx.Response(500, text="Error"))
-        output = str(tmp_path / "out.json")
-        config = _make_config(export={"format": "json", "output": output})
+    async def test_fetch_failure(self, router, fast_sleep):
+        # Runs on the client scrape() builds from the config, retries included.
+        page = router.get("https://example.com/page/1").mock(
+            return_value=httpx.Response(500, text="Error")
+        )
+        config = _make_config(retry={"max_attempts": 3})
         result = await scrape(config)
         assert result.errors >= 1
         assert result.items_found == 0
+        assert page.call_count == 3
 
-    @pytest.mark.asyncio
-    @respx.mock
-    async def test_csv_export(self, sample_html, tmp_path):
-        respx.get("https://example.com/robots.txt").mock(return_value=httpx.Response(404))
-        respx.get("https://example.com/page/1").mock(
-            return_value=httpx.Response(200, text=sample_html)
+    async def test_csv_export(self, router, shared_client, sample_html_bytes, tmp_path):
+        router.get("https://example.com/page/1").mock(
+            return_value=_html_response(sample_html_bytes)
         )
         output = str(tmp_path / "out.csv")
         config = _make_config(export={"format": "csv", "output": output})
-        result = await scrape(config)
+        result = await scrape(config, client=shared_client)
         assert result.items_found == 3
         import csv
 
         with open(output, newline="") as f:
             rows = list(csv.DictReader(f))
         assert len(rows) == 3
+
+    async def test_streams_to_exporter_without_collecting(
+        self, router, shared_client, sample_html_bytes, tmp_path
+    ):
+        router.get("https://example.com/page/1").mock(
+            return_value=_html_response(sample_html_bytes)
+        )
+        output = tmp_path / "out.json"
+        config = _make_config(export={"format": "json", "output": str(output)})
+        result = await scrape(config, client=shared_client, collect_data=False)
+        assert result.items_found == 3
+        assert result.data == []
+        assert len(json.loads(output.read_text())) == 3
+
+    async def test_no_items_writes_no_output(self, router, shared_client, tmp_path):
+        router.get("https://example.com/page/1").mock(
+            return_value=httpx.Response(200, text="<html></html>")
+        )
+        output = tmp_path / "out.json"
+        result = await scrape(
+            _make_config(export={"format": "json", "output": str(output)}), client=shared_client
+        )
+        assert result.items_found == 0
+        assert not output.exists()
+
+    async def test_data_kept_in_input_url_order(
+        self, router, shared_client, sample_html_bytes, sample_html_page2_bytes
+    ):
+        async def slow_first_page(request):
+            await asyncio.sleep(0.02)
+            return _html_response(sample_html_bytes)
+
+        router.get("https://example.com/page/1").mock(side_effect=slow_first_page)
+        router.get("https://example.com/page/2").mock(
+            return_value=_html_response(sample_html_page2_bytes)
+        )
+        config = _make_config(urls=["https://example.com/page/1", "https://example.com/page/2"])
+        result = await scrape(config, client=shared_client)
+        assert [row["title"] for row in result.data] == [
+            "First Item",
+            "Second Item",
+            "Third Item",
+            "Fourth Item",
+        ]
+
+    async def test_export_error_stops_scrape(
+        self, router, shared_client, sample_html_bytes, monkeypatch
+    ):
+        def fail(self, rows):
+            raise OSError("No space left on device")
+
+        monkeypatch.setattr(JsonExporter, "write_rows", fail)
+        router.get("https://example.com/page/1").mock(
+            return_value=_html_response(sample_html_bytes)
+        )
+        with pytest.raises(OSError, match="No space"):
+            await scrape(_make_config(), client=shared_client)
+
+    async def test_cancel_aborts_exporter(
+        self, router, shared_client, sample_html_bytes, monkeypatch
+    ):
+        exporter = _RecordingExporter()
+        monkeypatch.setattr(scraper_module, "_get_exporter", lambda fmt: exporter)
+
+        async def never_responds(request):
+            await asyncio.Event().wait()
+
+        router.get("https://example.com/page/1").mock(
+            return_value=_html_response(sample_html_bytes)
+        )
+        router.get("https://example.com/page/2").mock(side_effect=never_responds)
+        config = _make_config(urls=["https://example.com/page/1", "https://example.com/page/2"])
+        job = asyncio.create_task(scrape(config, client=shared_client))
+        for _ in range(100):
+            if exporter.rows:
+                break
+            await asyncio.sleep(0.01)
+        job.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await job
+        assert len(exporter.rows) == 3
+        assert exporter.aborted
+        assert not exporter.closed
+
+    async def test_non_utf8_page_decoded_by_charset(self, router, shared_client):
+        html = '<article class="item"><h2 class="title">Café</h2></article>'
+        router.get("https://example.com/page/1").mock(
+            return_value=httpx.Response(
+                200,
+                content=html.encode("latin-1"),
+                headers={"Content-Type": "text/html; charset=iso-8859-1"},
+            )
+        )
+        config = _make_config()
+        result = await scrape(config, client=shared_client)
+        assert result.data[0]["title"] == "Café"
+
+    async def test_progress_callback(self, router, shared_client, sample_html_bytes):
+        router.get("https://example.com/page/1").mock(
+            return_value=_html_response(sample_html_bytes)
+        )
+        calls = []
+        config = _make_config()
+        await scrape(
+            config, client=shared_client, on_progress=lambda url, n: calls.append((url, n))
+        )
+        assert calls == [("https://example.com/page/1", 3)]
+        result = await scrape(config, client=shared_client, on_progress="not callable")
+        assert result.items_found == 3
+
+    async def test_shared_robots_checker_across_jobs(
+        self, router, shared_client, sample_html_bytes
+    ):
+        robots = router["robots"]
+        router.get("https://example.com/page/1").mock(
+            return_value=_html_response(sample_html_bytes)
+        )
+        checker = RobotsChecker()
+        config = _make_config()
+        await scrape(config, client=shared_client, robots_checker=checker)
+        result = await scrape(config, client=shared_client, robots_checker=checker)
+        assert result.items_found == 3
+        assert robots.call_count == 1
+
+    async def test_reuses_open_client_across_jobs(self, router, sample_html_bytes):
+        router.get("https://example.com/page/1").mock(
+            return_value=_html_response(sample_html_bytes)
+        )
+        config = _make_config()
+        async with HttpClient(RateLimiter(default_rate=100.0, default_burst=100)) as client:
+            first = await scrape(config, client=client)
+            second = await scrape(config, client=client)
+            assert (await client.fetch("https://example.com/page/1")).success
+        assert first.items_found == second.items_found == 3
+
+    async def test_crawl_delay_applied_to_borrowed_client(self, router, sample_html_bytes):
+        router.get("https://example.com/robots.txt").mock(
+            return_value=httpx.Response(200, text="User-agent: *\nCrawl-delay: 1\n")
+        )
+        router.get("https://example.com/page/1").mock(
+            return_value=_html_response(sample_html_bytes)
+        )
+        async with HttpClient(RateLimiter(default_rate=100.0, default_burst=100)) as client:
+            await scrape(_make_config(), client=client)
+            assert client.rate_limiter.get_bucket("https://example.com/").rate == 1.0
+
+    async def test_duplicate_urls_fetched_once(self, router, shared_client, sample_html_bytes):
+        robots = router["robots"]
+        page = router.get("https://example.com/page/1").mock(
+            return_value=_html_response(sample_html_bytes)
+        )
+        config = _make_config(
+            urls=["https://example.com/page/1"] * 3,
+        )
+        result = await scrape(config, client=shared_client)
+        assert result.items_found == 3
+        assert page.call_count == 1
+        assert robots.call_count == 1
+
+    async def test_robots_fetched_concurrently_per_domain(
+        self, router, shared_client, sample_html_bytes
+    ):
+        active = peak = 0
+
+        async def slow_robots(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(404)
+
+        router.get(url__regex=r"https://[ab]\.example\.com/robots\.txt").mock(
+            side_effect=slow_robots
+        )
+        router.get(url__regex=r"https://[ab]\.example\.com/page/1").mock(
+            return_value=_html_response(sample_html_bytes)
+        )
+        config = _make_config(
+            urls=["https://a.example.com/page/1", "https://b.example.com/page/1"],
+        )
+        result = await scrape(config, client=shared_client)
+        assert result.urls_scraped == 2
+        assert peak == 2
+
+    async def test_large_pages_parsed_in_worker_process(
+        self,
+        router,
+        shared_client,
+        sample_html_bytes,
+        sample_html_page2_bytes,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(scraper_module, "PARSE_OFFLOAD_THRESHOLD", 0)
+        router.get("https://example.com/page/1").mock(
+            return_value=_html_response(sample_html_bytes)
+        )
+        router.get("https://example.com/page/2").mock(
+            return_value=_html_response(sample_html_page2_bytes)
+        )
+        config = _make_config(
+            pagination={"enabled": True, "next_selector": "a.next-page::attr(href)"},
+        )
+        result = await scrape(config, client=shared_client)
+        assert result.urls_scraped == 2
+        assert result.items_found == 4
+
+    async def test_broken_parse_pool_is_replaced(
+        self, router, shared_client, sample_html_bytes, monkeypatch
+    ):
+        broken = _BrokenPool()
+        monkeypatch.setattr(scraper_module, "PARSE_OFFLOAD_THRESHOLD", 0)
+        monkeypatch.setattr(scraper_module, "_parse_pool", broken)
+        router.get("https://example.com/page/1").mock(
+            return_value=_html_response(sample_html_bytes)
+        )
+        failed = await scrape(_make_config(), client=shared_client)
+        assert failed.errors == 1
+        assert broken.shut_down
+        assert scraper_module._parse_pool is None
+
+        result = await scrape(_make_config(), client=shared_client)
+        scraper_module._shutdown_parse_pool()
+        assert result.items_found == 3
+
+    async def test_max_inflight_bounds_concurrent_urls(self, router, sample_html_bytes):
+        active = peak = 0
+
+        async def slow_page(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return _html_response(sample_html_bytes)
+
+        router.get(url__regex=r"https://example\.com/page/\d+").mock(side_effect=slow_page)
+        config = _make_config(
+            urls=[f"https://example.com/page/{i}" for i in range(6)],
+            concurrency={"max_inflight": 2},
+        )
+        result = await scrape(config)
+        assert result.urls_scraped == 6
+        assert peak == 2
+
+
+def test_run_sync_falls_back_to_asyncio(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    async def answer():
+        await asyncio.sleep(0)
+        return 42
+
+    assert run_sync(answer()) == 42
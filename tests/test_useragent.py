@@ -1,5 +1,7 @@
 """Tests for user-agent rotation pool."""
 
+from itertools import cycle, islice
+
 from webscrape.useragent import USER_AGENTS, UserAgentRotator
 
 
@@ -16,8 +18,7 @@ class TestUserAgentRotator:
     def test_round_robin_wraps(self):
         agents = ["UA1", "UA2", "UA3"]
         rotator = UserAgentRotator(agents)
-        results = [rotator.get_ua() for _ in range(6)]
-        assert results == ["UA1", "UA2", "UA3", "UA1", "UA2", "UA3"]
+        assert [rotator.get_ua() for _ in range(6)] == list(islice(cycle(agents), 6))
 
     def test_random_ua_from_pool(self):
         rotator = UserAgentRotator()